@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Cache benchmark: hit ratio and hit/miss latency under skewed workloads
+
+Generates a keyspace of distinct expressions, replays uniform, Zipf and
+hot-set-shift access sequences against /api/v1/solve, and infers hits and
+misses from the returned problem_hash and computation_time.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+import requests
+from typing import Dict, List, Any, Optional
+
+PATTERNS = ["uniform", "zipf", "hotset"]
+
+
+def make_keyspace(size: int) -> List[Dict[str, Any]]:
+    """Build `size` distinct mathematical problems of comparable engine cost"""
+    return [
+        {
+            "expression": f"sin({1 + k / size:.9f}*ξ) * exp(-ξ^2)",
+            "description": f"Cache benchmark key {k}"
+        }
+        for k in range(size)
+    ]
+
+
+def access_sequence(pattern: str, keyspace_size: int, length: int, seed: int = 0,
+                    zipf_exponent: float = 1.0, hot_fraction: float = 0.1,
+                    hot_share: float = 0.9, shift_every: Optional[int] = None) -> np.ndarray:
+    """Return `length` key indices drawn from the requested access pattern"""
+    rng = np.random.default_rng(seed)
+    if pattern == "uniform":
+        return rng.integers(0, keyspace_size, size=length)
+
+    if pattern == "zipf":
+        # Bounded Zipf: P(rank k) ∝ 1/k^s over the whole keyspace, with ranks
+        # scattered over the keys so popularity is not correlated with key order.
+        weights = 1.0 / np.arange(1, keyspace_size + 1) ** zipf_exponent
+        cdf = np.cumsum(weights)
+        ranks = np.searchsorted(cdf, rng.random(length) * cdf[-1])
+        return rng.permutation(keyspace_size)[ranks]
+
+    if pattern == "hotset":
+        # A hot set of hot_fraction of the keys takes hot_share of the traffic
+        # and moves to a fresh region of the keyspace every shift_every requests.
+        hot_size = max(1, int(keyspace_size * hot_fraction))
+        shift_every = shift_every or max(1, length // 4)
+        epoch = np.arange(length) // shift_every
+        hot_start = (epoch * hot_size) % keyspace_size
+        hot_keys = (hot_start + rng.integers(0, hot_size, size=length)) % keyspace_size
+        cold_keys = rng.integers(0, keyspace_size, size=length)
+        return np.where(rng.random(length) < hot_share, hot_keys, cold_keys)
+
+    raise ValueError(f"Unknown access pattern '{pattern}', choose from {PATTERNS}")
+
+
+def classify_hits(hashes: List[str], engine_times: np.ndarray,
+                  hit_time_fraction: float = 0.2) -> np.ndarray:
+    """Infer which responses were cache hits
+
+    The first occurrence of a problem_hash after the cache was cleared is a
+    compulsory miss, which calibrates what a real solve costs. Any repeat whose
+    reported computation_time falls below hit_time_fraction of the fast end of
+    that distribution is counted as a hit; slower repeats were evicted misses.
+    """
+    seen = set()
+    first = np.zeros(len(hashes), dtype=bool)
+    for i, key in enumerate(hashes):
+        if key not in seen:
+            seen.add(key)
+            first[i] = True
+
+    threshold = hit_time_fraction * np.percentile(engine_times[first], 10) if first.any() else 0.0
+    return ~first & (engine_times < threshold)
+
+
+def _summary(latencies: np.ndarray) -> Dict[str, Optional[float]]:
+    if latencies.size == 0:
+        return {"count": 0, "p50_ms": None, "p99_ms": None}
+    p50, p99 = np.percentile(latencies * 1000.0, [50, 99])
+    return {"count": int(latencies.size), "p50_ms": float(p50), "p99_ms": float(p99)}
+
+
+class CacheBenchmark:
+    """Replay access sequences against the engine and measure its cache"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 20):
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        self.timeout = timeout
+
+    def cache_capacity(self) -> Optional[int]:
+        """Cache capacity advertised by /api/v1/stats, if the engine reports one"""
+        response = self.session.get(f"{self.base_url}/api/v1/stats", timeout=self.timeout)
+        if response.status_code != 200:
+            return None
+        return response.json().get("cache_capacity")
+
+    def clear_cache(self):
+        response = self.session.post(f"{self.base_url}/api/v1/clear", timeout=self.timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"Cannot clear engine cache: {response.status_code}")
+
+    def replay(self, keyspace: List[Dict[str, Any]], sequence: np.ndarray) -> Dict[str, Any]:
+        """Send every key of the sequence in order, returning raw observations"""
+        hashes, engine_times, latencies = [], [], []
+        for key in sequence:
+            start = time.perf_counter()
+            response = self.session.post(
+                f"{self.base_url}/api/v1/solve",
+                json={"problem_data": keyspace[key], "problem_type": "mathematical"},
+                timeout=self.timeout
+            )
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise RuntimeError(f"Solve failed with {response.status_code}: {response.text}")
+            result = response.json()
+            hashes.append(result.get("problem_hash", ""))
+            engine_times.append(result.get("computation_time", 0.0))
+        return {
+            "hashes": hashes,
+            "engine_times": np.asarray(engine_times, dtype=float),
+            "latencies": np.asarray(latencies, dtype=float)
+        }
+
+    def run_point(self, pattern: str, working_set: int, cold_requests: int,
+                  warm_requests: int, seed: int = 0, **pattern_options) -> Dict[str, Any]:
+        """Measure one (pattern, working-set size) point with a cold then a warm phase"""
+        keyspace = make_keyspace(working_set)
+        sequence = access_sequence(pattern, working_set, cold_requests + warm_requests,
+                                   seed, **pattern_options)
+        self.clear_cache()
+        observed = self.replay(keyspace, sequence)
+        hits = classify_hits(observed["hashes"], observed["engine_times"])
+        latencies = observed["latencies"]
+
+        point = {"pattern": pattern, "working_set": working_set}
+        phases = {"cold": slice(0, cold_requests), "warm": slice(cold_requests, None)}
+        for phase, window in phases.items():
+            phase_hits, phase_latencies = hits[window], latencies[window]
+            point[phase] = {
+                "requests": int(phase_hits.size),
+                "hit_ratio": float(phase_hits.mean()) if phase_hits.size else None,
+                "hit_latency": _summary(phase_latencies[phase_hits]),
+                "miss_latency": _summary(phase_latencies[~phase_hits])
+            }
+        return point
+
+    def run(self, patterns: List[str], working_sets: List[int], cold_requests: int,
+            warm_requests: int, seed: int = 0, **pattern_options) -> Dict[str, Any]:
+        """Sweep working-set sizes for each pattern and collect hit-ratio/latency curves"""
+        curves = {pattern: [] for pattern in patterns}
+        for pattern in patterns:
+            for working_set in working_sets:
+                curves[pattern].append(self.run_point(pattern, working_set, cold_requests,
+                                                      warm_requests, seed, **pattern_options))
+        return {"base_url": self.base_url, "cache_capacity": self.cache_capacity(), "curves": curves}
+
+
+def print_curves(report: Dict[str, Any]):
+    """Print the hit-ratio and latency curves of a benchmark report"""
+    print("=" * 78)
+    print(f"CTT CACHE BENCHMARK  {report['base_url']}  capacity={report['cache_capacity']}")
+    print("=" * 78)
+    for pattern, points in report["curves"].items():
+        print(f"\n{pattern}")
+        print(f"{'working set':>12}{'cold hit%':>11}{'warm hit%':>11}"
+              f"{'hit p50':>10}{'hit p99':>10}{'miss p50':>10}{'miss p99':>10}  (ms)")
+        for point in points:
+            warm = point["warm"]
+            cells = [warm["hit_latency"]["p50_ms"], warm["hit_latency"]["p99_ms"],
+                     warm["miss_latency"]["p50_ms"], warm["miss_latency"]["p99_ms"]]
+            print(f"{point['working_set']:>12}{100 * (point['cold']['hit_ratio'] or 0):>10.1f}%"
+                  f"{100 * (warm['hit_ratio'] or 0):>10.1f}%"
+                  + "".join(f"{c:>10.2f}" if c is not None else f"{'-':>10}" for c in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CTT engine cache benchmark")
+    parser.add_argument("--url", default="http://localhost:8000", help="Engine base URL")
+    parser.add_argument("--patterns", nargs="+", default=PATTERNS, choices=PATTERNS)
+    parser.add_argument("--capacity", type=int, default=None,
+                        help="Engine cache capacity (default: read from /api/v1/stats)")
+    parser.add_argument("--working-sets", nargs="+", type=int, default=None,
+                        help="Keyspace sizes to test (default: 0.25x to 8x capacity)")
+    parser.add_argument("--cold-requests", type=int, default=500)
+    parser.add_argument("--warm-requests", type=int, default=2000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.0)
+    parser.add_argument("--hot-fraction", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Also write the curves to this JSON file")
+    args = parser.parse_args()
+
+    benchmark = CacheBenchmark(args.url)
+    working_sets = args.working_sets
+    if working_sets is None:
+        capacity = args.capacity or benchmark.cache_capacity() or 1024
+        working_sets = [max(1, int(capacity * f)) for f in (0.25, 0.5, 1, 2, 4, 8)]
+
+    report = benchmark.run(args.patterns, working_sets, args.cold_requests, args.warm_requests,
+                           args.seed, zipf_exponent=args.zipf_exponent,
+                           hot_fraction=args.hot_fraction)
+    print_curves(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Cache curves saved to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
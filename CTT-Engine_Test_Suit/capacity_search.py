@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Open-loop capacity search: the highest request rate /api/v1/solve sustains within a latency SLO
+
+For each problem_type the catalog problems of that type (ctt_problems.PROBLEMS)
+are offered open-loop at a target rate: requests start on schedule whether or
+not earlier ones have finished, and latency is measured from the scheduled
+start, so a backed-up engine shows up as latency instead of quietly lowering
+the offered load. Each step holds a rate for step_duration seconds and passes
+when the SLO percentile stays under the SLO, errors stay rare and the engine
+keeps up with the offered rate.
+
+The rate is searched either by doubling until a step fails and then bisecting
+(binary), or additive-increase/multiplicative-decrease (aimd). The knee is the
+highest passing rate; every step is kept as the throughput-vs-latency curve.
+
+    python capacity_search.py --slo-ms 100 --problem-types physics
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+from ctt_async_client import AsyncCTTClient
+from ctt_problems import PROBLEMS, solve_payload
+from load_generator import latency_summary
+
+MODES = ["binary", "aimd"]
+DEFAULT_SLO_MS = 100.0
+# A step fails if more than this share of requests errors, or the engine completes
+# less than MIN_THROUGHPUT_RATIO of what was offered
+MAX_ERROR_RATE = 0.01
+MIN_THROUGHPUT_RATIO = 0.9
+# Bisection never probes below this rate (req/s), so an engine that fails every step ends the search
+DEFAULT_MIN_RATE = 1.0
+MAX_BISECTIONS = 30
+
+
+def problem_types() -> List[str]:
+    """problem_types in the catalog, in first-seen order"""
+    return list(dict.fromkeys(entry["problem_type"] for entry in PROBLEMS.values()))
+
+
+class CapacitySearch:
+    """Search the sustainable request rate of one problem_type against a latency SLO"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", slo_ms: float = DEFAULT_SLO_MS,
+                 percentile: float = 99, step_duration: float = 5.0, initial_rate: float = 10.0,
+                 max_rate: float = 10000.0, tolerance: float = 0.05, max_connections: int = 256,
+                 request_timeout: float = 10.0, min_rate: float = DEFAULT_MIN_RATE):
+        self.base_url = base_url.rstrip('/')
+        self.slo_ms = slo_ms
+        self.percentile = percentile
+        self.step_duration = step_duration
+        self.initial_rate = initial_rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.tolerance = tolerance
+        self.max_connections = max_connections
+        self.request_timeout = request_timeout
+
+    async def step(self, client: AsyncCTTClient, names: List[str], rate: float) -> Dict[str, Any]:
+        """Offer `rate` requests/s open-loop for one step and judge it against the SLO"""
+        total = max(1, int(rate * self.step_duration))
+        latencies: List[float] = []
+        errors = 0
+        last_completion = 0.0
+
+        async def send(index: int, scheduled: float):
+            nonlocal errors, last_completion
+            payload = solve_payload(names[index % len(names)])
+            try:
+                response = await client.solve(payload["problem_data"], payload["problem_type"],
+                                              timeout=self.request_timeout)
+                ok = response.status_code == 200
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                ok = False
+            finished = time.perf_counter()
+            last_completion = max(last_completion, finished)
+            if ok:
+                latencies.append(finished - scheduled)
+            else:
+                errors += 1
+
+        tasks = []
+        start = time.perf_counter()
+        sent = 0
+        while sent < total:
+            # Launch everything due by now, so timer granularity never lowers the rate
+            due = min(total, int((time.perf_counter() - start) * rate) + 1)
+            for index in range(sent, due):
+                tasks.append(asyncio.ensure_future(send(index, start + index / rate)))
+            sent = due
+            if sent < total:
+                await asyncio.sleep(max(0.0, start + sent / rate - time.perf_counter()))
+        await asyncio.gather(*tasks)
+
+        elapsed = max(last_completion - start, total / rate)
+        result = {"offered_rps": rate, **latency_summary(latencies, elapsed), "errors": errors}
+        result["achieved_rps"] = result.pop("throughput_rps")
+        result["slo_latency_ms"] = float(np.percentile(latencies, self.percentile)) * 1000 if latencies else None
+        result["passed"] = (
+            result["slo_latency_ms"] is not None
+            and result["slo_latency_ms"] <= self.slo_ms
+            and errors <= MAX_ERROR_RATE * total
+            and result["achieved_rps"] >= MIN_THROUGHPUT_RATIO * rate
+        )
+        return result
+
+    async def search(self, problem_type: str, mode: str = "binary", aimd_steps: int = 20,
+                     aimd_increase: Optional[float] = None, aimd_decrease: float = 0.5) -> Dict[str, Any]:
+        """Find the knee for one problem_type, returning it with the measured curve"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown search mode '{mode}', choose from {MODES}")
+        names = [name for name, entry in PROBLEMS.items() if entry["problem_type"] == problem_type]
+        if not names:
+            raise ValueError(f"No catalog problems of type '{problem_type}', choose from {problem_types()}")
+
+        curve = []
+        async with AsyncCTTClient(self.base_url, max_connections=self.max_connections) as client:
+            async def measure(rate: float) -> bool:
+                result = await self.step(client, names, rate)
+                curve.append(result)
+                return result["passed"]
+
+            if mode == "binary":
+                # Double until a step fails, then bisect between the last pass and the first failure;
+                # with no pass yet, give up once the failing rate drops below min_rate
+                good, bad, rate = 0.0, None, self.initial_rate
+                while rate <= self.max_rate:
+                    if not await measure(rate):
+                        bad = rate
+                        break
+                    good, rate = rate, rate * 2
+                bisections = 0
+                while (bad is not None and bad - good > self.tolerance * bad
+                       and not (good == 0.0 and bad < self.min_rate) and bisections < MAX_BISECTIONS):
+                    bisections += 1
+                    rate = (good + bad) / 2
+                    if await measure(rate):
+                        good = rate
+                    else:
+                        bad = rate
+            else:
+                increase = aimd_increase or self.initial_rate
+                rate = self.initial_rate
+                for _ in range(aimd_steps):
+                    rate = rate + increase if await measure(rate) else rate * aimd_decrease
+                    rate = min(rate, self.max_rate)
+
+        passing = [point for point in curve if point["passed"]]
+        knee = max(passing, key=lambda point: point["offered_rps"]) if passing else None
+        return {
+            "problem_type": problem_type,
+            "problems": names,
+            "mode": mode,
+            "slo_ms": self.slo_ms,
+            "percentile": self.percentile,
+            "knee": knee,
+            "curve": sorted(curve, key=lambda point: point["offered_rps"])
+        }
+
+
+def print_search(result: Dict[str, Any]):
+    """Pretty-print the curve and knee of one search"""
+    print("=" * 86)
+    print(f"CAPACITY {result['problem_type']}  ({', '.join(result['problems'])})  "
+          f"SLO p{result['percentile']:g} ≤ {result['slo_ms']:g} ms  [{result['mode']}]")
+    print("=" * 86)
+    print(f"{'offered/s':>10}{'achieved/s':>12}{'err':>6}{'p50':>10}{'p99':>10}"
+          f"{'SLO pct':>10}  verdict   (ms)")
+    for point in result["curve"]:
+        if not point["requests"]:
+            print(f"{point['offered_rps']:>10.1f}{0.0:>12.1f}{point['errors']:>6}{'-':>10}{'-':>10}{'-':>10}  fail")
+            continue
+        print(f"{point['offered_rps']:>10.1f}{point['achieved_rps']:>12.1f}{point['errors']:>6}"
+              f"{point['p50_ms']:>10.2f}{point['p99_ms']:>10.2f}{point['slo_latency_ms']:>10.2f}  "
+              f"{'pass' if point['passed'] else 'fail'}")
+    knee = result["knee"]
+    if knee is None:
+        print(f"✗ No passing rate: nothing down to {result['curve'][0]['offered_rps']:.2f}/s met the SLO")
+    else:
+        print(f"✓ Knee: {knee['offered_rps']:.1f} req/s sustained at p{result['percentile']:g} "
+              f"{knee['slo_latency_ms']:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the CTT engine's sustainable request rate per problem_type")
+    parser.add_argument("--url", default="http://localhost:8000", help="Engine base URL")
+    parser.add_argument("--problem-types", nargs="+", default=None,
+                        help=f"problem_types to search (default: all of {problem_types()})")
+    parser.add_argument("--slo-ms", type=float, default=DEFAULT_SLO_MS, help="Latency SLO in milliseconds")
+    parser.add_argument("--percentile", type=float, default=99, help="Percentile the SLO applies to")
+    parser.add_argument("--mode", choices=MODES, default="binary", help="Rate search strategy")
+    parser.add_argument("--initial-rate", type=float, default=10.0, help="First offered rate (req/s)")
+    parser.add_argument("--max-rate", type=float, default=10000.0, help="Never offer more than this")
+    parser.add_argument("--min-rate", type=float, default=DEFAULT_MIN_RATE,
+                        help="Stop searching downward below this rate when nothing passes")
+    parser.add_argument("--step-duration", type=float, default=5.0, help="Seconds each rate is held")
+    parser.add_argument("--tolerance", type=float, default=0.05,
+                        help="Binary search stops when the bracket is this fraction of the rate")
+    parser.add_argument("--aimd-steps", type=int, default=20, help="Steps taken in aimd mode")
+    parser.add_argument("--output", default=None, help="Also write the curves to this JSON file")
+    args = parser.parse_args()
+
+    search = CapacitySearch(args.url, args.slo_ms, args.percentile, args.step_duration,
+                            args.initial_rate, args.max_rate, args.tolerance,
+                            min_rate=args.min_rate)
+    results = []
+    for problem_type in args.problem_types or problem_types():
+        result = asyncio.run(search.search(problem_type, args.mode, args.aimd_steps))
+        print_search(result)
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Capacity curves saved to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Minimal asyncio HTTP/1.1 client for the CTT engine API
+
+Every response carries its per-phase latency breakdown in response.timings
+(see ctt_tracing.py); pass a TraceRecorder as tracer to aggregate them.
+"""
+
+import asyncio
+import json
+import socket
+import time
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ctt_binary import BINARY_CONTENT_TYPE, decode_body, encode_binary, pack_arrays
+from ctt_tracing import PhaseTimer, TraceRecorder, client_trace
+
+# Job states after which /api/v1/jobs polling stops, and ids polled per request
+JOB_FINISHED = ("completed", "failed", "cancelled", "unknown")
+JOB_POLL_BATCH = 1000
+
+
+class AsyncResponse:
+    """Response of an AsyncCTTClient request, shaped like requests.Response"""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes,
+                 timings: Optional[Dict[str, int]] = None, tracer: Optional[TraceRecorder] = None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        # Phase -> nanoseconds, client phases plus the server's from its Server-Timing header
+        self.timings = timings if timings is not None else {}
+        self.tracer = tracer
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def _decoded(self, decode, *args) -> Any:
+        start = time.perf_counter_ns()
+        value = decode(*args)
+        self.timings["decode"] = time.perf_counter_ns() - start
+        if self.tracer is not None:
+            self.tracer.record({"decode": self.timings["decode"]})
+        return value
+
+    def json(self) -> Any:
+        return self._decoded(json.loads, self.content)
+
+    def data(self) -> Any:
+        """Decoded body, JSON or binary by Content-Type; binary arrays are views of content"""
+        return self._decoded(decode_body, self.content, self.headers.get("content-type", ""))
+
+
+class AsyncCTTClient:
+    """Keep-alive connection pool issuing concurrent requests to the CTT engine"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", max_connections: int = 100,
+                 tracer: Optional[TraceRecorder] = None):
+        parts = urlsplit(base_url.rstrip('/'))
+        if parts.scheme != "http":
+            raise ValueError(f"Only plain http:// engines are supported, got {base_url}")
+        self.base_url = base_url.rstrip('/')
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 80
+        self.max_connections = max_connections
+        self.tracer = tracer
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncCTTClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        await self._slots.acquire()
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self._slots.release()
+            raise
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return reader, writer
+
+    def _release(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reuse: bool) -> None:
+        if reuse:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        self._slots.release()
+
+    async def request(self, method: str, path: str, body: Optional[bytes] = None,
+                      headers: Optional[Dict[str, str]] = None, timeout: float = 30,
+                      timer: Optional[PhaseTimer] = None) -> AsyncResponse:
+        """Send one request over a pooled connection and read the full response
+
+        timer carries phases already timed by the caller, such as serialize.
+        """
+        timer = timer or PhaseTimer()
+        reader, writer = await self._acquire()
+        timer.mark("acquire")
+        reuse = False
+        try:
+            response = await asyncio.wait_for(
+                self._exchange(reader, writer, method, path, body, headers or {}, timer),
+                timeout
+            )
+            reuse = response.headers.get("connection", "").lower() != "close"
+        finally:
+            self._release(reader, writer, reuse)
+        response.timings = client_trace(timer.timings, response.headers.get("server-timing"))
+        response.tracer = self.tracer
+        if self.tracer is not None:
+            self.tracer.record({**response.timings, "total": timer.total()})
+        return response
+
+    async def _exchange(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        method: str, path: str, body: Optional[bytes],
+                        headers: Dict[str, str], timer: PhaseTimer) -> AsyncResponse:
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in headers.items():
+            lines.append(f"{name}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+        timer.mark("upload")
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        timer.mark("wait")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        status_code = int(status_line.split(" ", 2)[1])
+        response_headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            content = await self._read_chunked(reader)
+        elif "content-length" in response_headers:
+            content = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            content = await reader.read()
+            response_headers["connection"] = "close"
+        timer.mark("download")
+        return AsyncResponse(status_code, response_headers, content)
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    async def get(self, path: str, timeout: float = 10) -> AsyncResponse:
+        """GET an API path such as /api/v1/health"""
+        return await self.request("GET", path, timeout=timeout)
+
+    async def post_json(self, path: str, payload: Any, timeout: float = 30) -> AsyncResponse:
+        """POST a JSON document to an API path"""
+        timer = PhaseTimer()
+        body = json.dumps(payload).encode("utf-8")
+        timer.mark("serialize")
+        return await self.request("POST", path, body,
+                                  {"Content-Type": "application/json"}, timeout, timer)
+
+    async def solve(self, problem_data: Any, problem_type: str, timeout: float = 30,
+                    binary: bool = False) -> AsyncResponse:
+        """POST a problem to /api/v1/solve
+
+        binary=True sends large numeric arrays as .npy parts and asks for a
+        binary response; read it with response.data().
+        """
+        if binary:
+            timer = PhaseTimer()
+            body, content_type = encode_binary({"problem_data": pack_arrays(problem_data),
+                                                "problem_type": problem_type})
+            timer.mark("serialize")
+            return await self.request("POST", "/api/v1/solve", body,
+                                      {"Content-Type": content_type, "Accept": BINARY_CONTENT_TYPE},
+                                      timeout, timer)
+        return await self.post_json(
+            "/api/v1/solve",
+            {"problem_data": problem_data, "problem_type": problem_type},
+            timeout
+        )
+
+    async def solve_batch(self, problems: List[Dict[str, Any]], timeout: float = 30) -> AsyncResponse:
+        """POST a list of {problem_data, problem_type} items to /api/v1/solve/batch"""
+        return await self.post_json("/api/v1/solve/batch", {"problems": problems}, timeout)
+
+    async def submit_job(self, problem_data: Any, problem_type: str, timeout: float = 30) -> str:
+        """Submit a solve to /api/v1/jobs and return its job id"""
+        response = await self.post_json("/api/v1/jobs",
+                                        {"problem_data": problem_data, "problem_type": problem_type},
+                                        timeout)
+        if response.status_code != 202:
+            raise RuntimeError(f"Job submission failed: {response.status_code} - {response.text}")
+        return response.json()["job_id"]
+
+    async def job_status(self, job_id: str, timeout: float = 10) -> Dict[str, Any]:
+        """Status, progress and partial or final result of a job"""
+        return (await self.get(f"/api/v1/jobs/{job_id}", timeout)).json()
+
+    async def cancel_job(self, job_id: str, timeout: float = 10) -> Dict[str, Any]:
+        return (await self.request("DELETE", f"/api/v1/jobs/{job_id}", timeout=timeout)).json()
+
+    async def gather_jobs(self, problems: List[Dict[str, Any]], poll_interval: float = 0.05,
+                          poll_batch: int = JOB_POLL_BATCH) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Submit {problem_data, problem_type} items as jobs and yield (index, final status) as each finishes"""
+        job_ids = await asyncio.gather(*[
+            self.submit_job(item["problem_data"], item.get("problem_type", "mathematical"))
+            for item in problems
+        ])
+        pending = {job_id: index for index, job_id in enumerate(job_ids)}
+        while pending:
+            ids = list(pending)
+            for start in range(0, len(ids), poll_batch):
+                response = await self.post_json("/api/v1/jobs/status",
+                                                {"job_ids": ids[start:start + poll_batch]})
+                for status in response.json()["jobs"]:
+                    if status["status"] in JOB_FINISHED:
+                        yield pending.pop(status["job_id"]), status
+            if pending:
+                await asyncio.sleep(poll_interval)
+
+    async def close(self) -> None:
+        """Close every idle pooled connection"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Binary transport for solve requests and responses: JSON plus raw .npy parts
+
+A binary message is a multipart/mixed body. Its first part is the JSON
+document with every array replaced by {"$ndarray": "<part name>"}; each
+array follows as its own application/x-npy part. Every part carries a
+Content-Length, so decoding never scans array bytes for the boundary, and
+arrays are decoded with np.frombuffer as read-only views of the received
+body instead of being parsed float by float.
+
+Negotiation on /api/v1/solve: send the request with
+Content-Type: multipart/mixed to pass arrays in binary, and add
+Accept: multipart/mixed to get large numeric results back as arrays.
+Plain JSON stays the default in both directions.
+"""
+
+import ast
+import io
+import json
+import uuid
+import numpy as np
+from typing import Dict, List, Any, Tuple
+
+BINARY_CONTENT_TYPE = "multipart/mixed"
+NPY_CONTENT_TYPE = "application/x-npy"
+# Numeric lists at least this long travel as arrays when packing a payload
+MIN_ARRAY_ELEMENTS = 1024
+
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a binary message cannot be decoded"""
+
+
+def numeric_array(value, min_elements: int = MIN_ARRAY_ELEMENTS):
+    """value as a numeric ndarray if it is a large, rectangular list or array of numbers, else None"""
+    if len(value) == 0 or isinstance(value[0], (str, dict, bool)):
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        return None
+    if array.dtype.kind not in "iuf" or array.size < min_elements:
+        return None
+    return array
+
+
+def pack_arrays(payload: Any, min_elements: int = MIN_ARRAY_ELEMENTS) -> Any:
+    """payload with large numeric lists replaced by ndarrays, ready for encode_binary"""
+    if isinstance(payload, dict):
+        return {key: pack_arrays(value, min_elements) for key, value in payload.items()}
+    if isinstance(payload, list):
+        array = numeric_array(payload, min_elements)
+        if array is not None:
+            return array
+        return [pack_arrays(value, min_elements) for value in payload]
+    return payload
+
+
+def _npy_header(array: np.ndarray) -> bytes:
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(header, np.lib.format.header_data_from_array_1_0(array))
+    return header.getvalue()
+
+
+def encode_binary(payload: Any) -> Tuple[bytes, str]:
+    """Encode a payload holding ndarrays as (body, content_type)"""
+    arrays: List[np.ndarray] = []
+
+    def extract(value):
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise BinaryFormatError("Object arrays cannot be sent in binary")
+            arrays.append(np.ascontiguousarray(value))
+            return {"$ndarray": f"array-{len(arrays) - 1}"}
+        if isinstance(value, dict):
+            return {key: extract(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [extract(item) for item in value]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    document = json.dumps(extract(payload)).encode("utf-8")
+    boundary = uuid.uuid4().hex
+    chunks = []
+
+    def part(name: str, content_type: str, content: List[Any], length: int):
+        chunks.append(f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+                      f"Content-Disposition: form-data; name=\"{name}\"\r\n"
+                      f"Content-Length: {length}\r\n\r\n".encode("ascii"))
+        chunks.extend(content)
+        chunks.append(b"\r\n")
+
+    part("request", "application/json", [document], len(document))
+    for index, array in enumerate(arrays):
+        header = _npy_header(array)
+        part(f"array-{index}", NPY_CONTENT_TYPE, [header, memoryview(array).cast("B")],
+             len(header) + array.nbytes)
+    chunks.append(f"--{boundary}--\r\n".encode("ascii"))
+    return b"".join(chunks), f"{BINARY_CONTENT_TYPE}; boundary={boundary}"
+
+
+def _boundary(content_type: str) -> bytes:
+    for parameter in content_type.split(";")[1:]:
+        name, _, value = parameter.strip().partition("=")
+        if name.lower() == "boundary":
+            return value.strip('"').encode("ascii")
+    raise BinaryFormatError(f"No boundary in Content-Type '{content_type}'")
+
+
+def _decode_npy(view: memoryview) -> np.ndarray:
+    """Array over the bytes of a .npy part, without copying them"""
+    if bytes(view[:6]) != _NPY_MAGIC:
+        raise BinaryFormatError("Array part is not in .npy format")
+    major = view[6]
+    if major == 1:
+        length, start = int.from_bytes(view[8:10], "little"), 10
+    elif major in (2, 3):
+        length, start = int.from_bytes(view[8:12], "little"), 12
+    else:
+        raise BinaryFormatError(f"Unsupported .npy version {major}")
+    try:
+        header = ast.literal_eval(bytes(view[start:start + length]).decode("latin1"))
+        dtype = np.lib.format.descr_to_dtype(header["descr"])
+        shape = tuple(header["shape"])
+    except (ValueError, SyntaxError, KeyError, TypeError) as e:
+        raise BinaryFormatError(f"Invalid .npy header: {e}")
+    if dtype.hasobject:
+        raise BinaryFormatError("Object arrays are not accepted")
+    count = int(np.prod(shape))
+    array = np.frombuffer(view, dtype=dtype, count=count, offset=start + length)
+    return array.reshape(shape, order="F" if header.get("fortran_order") else "C")
+
+
+def decode_binary(body: bytes, content_type: str) -> Any:
+    """Decode a multipart body from encode_binary; arrays are read-only views of body"""
+    delimiter = b"--" + _boundary(content_type)
+    view = memoryview(body)
+    parts: Dict[str, memoryview] = {}
+    position = 0
+    while True:
+        if bytes(view[position:position + len(delimiter)]) != delimiter:
+            raise BinaryFormatError("Malformed multipart body")
+        position += len(delimiter)
+        if bytes(view[position:position + 2]) == b"--":
+            break
+        header_end = body.find(b"\r\n\r\n", position)
+        if header_end < 0:
+            raise BinaryFormatError("Unterminated part headers")
+        headers = {}
+        for line in body[position:header_end].decode("latin1").split("\r\n"):
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        try:
+            name = headers["content-disposition"].split("name=", 1)[1].strip('"')
+            length = int(headers["content-length"])
+        except (KeyError, IndexError, ValueError):
+            raise BinaryFormatError("Every part needs a name and a Content-Length")
+        start = header_end + 4
+        parts[name] = view[start:start + length]
+        position = start + length + 2
+
+    if "request" not in parts:
+        raise BinaryFormatError("Missing JSON 'request' part")
+
+    def resolve(value):
+        if isinstance(value, dict):
+            if set(value) == {"$ndarray"}:
+                if value["$ndarray"] not in parts:
+                    raise BinaryFormatError(f"Missing array part '{value['$ndarray']}'")
+                return _decode_npy(parts[value["$ndarray"]])
+            return {key: resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [resolve(item) for item in value]
+        return value
+
+    return resolve(json.loads(bytes(parts["request"])))
+
+
+def is_binary(content_type: str) -> bool:
+    return (content_type or "").split(";")[0].strip().lower() == BINARY_CONTENT_TYPE
+
+
+def decode_body(body: bytes, content_type: str) -> Any:
+    """Decode a JSON or binary body according to its Content-Type"""
+    if is_binary(content_type):
+        return decode_binary(body, content_type)
+    return json.loads(body or b"null")
+
+
+def solve_binary(session, base_url: str, problem_data: Any, problem_type: str = "mathematical",
+                 timeout: float = 30, min_elements: int = MIN_ARRAY_ELEMENTS) -> Dict[str, Any]:
+    """POST a solve over a requests.Session in binary both ways and decode the response"""
+    body, content_type = encode_binary({"problem_data": pack_arrays(problem_data, min_elements),
+                                        "problem_type": problem_type})
+    response = session.post(f"{base_url.rstrip('/')}/api/v1/solve", data=body, timeout=timeout,
+                            headers={"Content-Type": content_type, "Accept": BINARY_CONTENT_TYPE})
+    if response.status_code != 200:
+        return {"status": "error", "error": f"{response.status_code} - {response.text}"}
+    return decode_body(response.content, response.headers.get("Content-Type", ""))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Asynchronous solve jobs for the CTT stand-in engine
+
+A job is submitted with one request and returns its id at once; a bounded
+pool of worker threads solves queued jobs in order. Solvers report progress
+and partial results through ctt_solvers.report_progress, which is also where
+a cancelled job stops: cancellation is cooperative and takes effect at the
+solver's next progress report (queued jobs are cancelled immediately).
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from ctt_solvers import ProblemError, progress_hook
+
+DEFAULT_WORKERS = 4
+# Finished jobs kept for polling before the oldest are forgotten
+DEFAULT_RETAINED_JOBS = 10000
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = "queued", "running", "completed", "failed", "cancelled"
+FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a solver, at its next progress report, once its job is cancelled"""
+
+
+class Job:
+    """One submitted solve and its progress"""
+
+    def __init__(self, problem_data: Any, problem_type: str):
+        self.job_id = uuid.uuid4().hex
+        self.problem_data = problem_data
+        self.problem_type = problem_type
+        self.status = QUEUED
+        self.progress = 0.0
+        self.partial_result: Optional[Dict[str, Any]] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancel_requested = threading.Event()
+
+    def report(self, fraction: float, partial: Optional[Dict[str, Any]] = None):
+        if self.cancel_requested.is_set():
+            raise JobCancelled(self.job_id)
+        self.progress = max(self.progress, min(1.0, float(fraction)))
+        if partial is not None:
+            self.partial_result = partial
+
+    def to_dict(self) -> Dict[str, Any]:
+        status = {
+            "job_id": self.job_id,
+            "problem_type": self.problem_type,
+            "status": self.status,
+            "progress": self.progress,
+            "submitted_at": self.submitted_at,
+            "elapsed": (self.finished_at or time.time()) - (self.started_at or self.submitted_at)
+        }
+        if self.status == COMPLETED:
+            status["result"] = self.result
+        elif self.partial_result is not None:
+            status["partial_result"] = self.partial_result
+        if self.error is not None:
+            status["error"] = self.error
+        return status
+
+
+class JobManager:
+    """Queue of solve jobs run by a pool of worker threads against one engine"""
+
+    def __init__(self, engine, workers: int = DEFAULT_WORKERS,
+                 retained_jobs: int = DEFAULT_RETAINED_JOBS):
+        self.engine = engine
+        self.retained_jobs = retained_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._finished_order: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ctt-job")
+
+    def submit(self, problem_data: Any, problem_type: str) -> Job:
+        job = Job(problem_data, problem_type)
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; a queued job is cancelled at once, a running one at its next report"""
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED:
+            return job
+        job.cancel_requested.set()
+        with self._lock:
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+        return job
+
+    def _run(self, job: Job):
+        with self._lock:
+            if job.status != QUEUED:
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            with progress_hook(job.report):
+                result = self.engine.solve(job.problem_data, job.problem_type)
+        except JobCancelled:
+            outcome = CANCELLED
+        except ProblemError as e:
+            job.error = str(e)
+            outcome = FAILED
+        except Exception as e:
+            job.error = f"Internal error: {e!r}"
+            outcome = FAILED
+        else:
+            job.result = result
+            job.progress = 1.0
+            job.partial_result = None
+            outcome = COMPLETED
+        with self._lock:
+            self._finish(job, outcome)
+
+    def _finish(self, job: Job, status: str):
+        # Called with the lock held
+        job.status = status
+        job.finished_at = time.time()
+        self._finished_order[job.job_id] = None
+        while len(self._finished_order) > self.retained_jobs:
+            forgotten, _ = self._finished_order.popitem(last=False)
+            self._jobs.pop(forgotten, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts = {status: 0 for status in (QUEUED, RUNNING) + FINISHED}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return counts
+
+    def statuses(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Status of every listed job, {"job_id", "status": "unknown"} for ids not held"""
+        statuses = []
+        for job_id in job_ids:
+            job = self.get(job_id)
+            statuses.append(job.to_dict() if job else {"job_id": job_id, "status": "unknown"})
+        return statuses
+
+    def shutdown(self):
+        """Cancel everything still queued or running and stop the workers"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self.cancel(job.job_id)
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Catalog of the CTT problem payloads exercised by the test suite
+"""
+
+import copy
+import hashlib
+import json
+import numpy as np
+from typing import Dict, List, Any
+
+from ctt_binary import numeric_array
+from xi_expression import ExpressionError, canonical_expression, canonical_number, canonical_numbers
+
+BASIC_MATHEMATICAL_PROBLEM = {
+    "expression": "sin(ξ) * exp(-ξ^2) + cos(2*π*ξ)",
+    "description": "Basic wavefunction with Gaussian envelope"
+}
+
+WAVE_CONVERGENCE_PROBLEM = {
+    "problem_type": "wave_convergence",
+    "wave_function": "sin(2*π*ξ) * exp(-ξ^2/2) + 0.5*cos(4*π*ξ) * exp(-ξ^2/4)",
+    "integration_range": [0, 5],
+    "convergence_analysis": {
+        "ξ_points": 1000,
+        "frequency_components": [1, 2, 4, 8],
+        "damping_factors": [0.1, 0.25, 0.5, 1.0]
+    }
+}
+
+ADVANCED_MATHEMATICAL_PROBLEM = {
+    "problem_id": "CTTE-2024-001",
+    "problem_type": "advanced_mathematical",
+    "title": "Temporal Resonance Fourier-Decomposition",
+
+    "core_function": "ψ(ξ) = Σ[n=1 to 5] [A_n * sin(2π*f_n*ξ) * exp(-α_n*ξ^2)]",
+
+    "parameters": {
+        "amplitudes": [1.0, 0.7, 0.5, 0.3, 0.2],
+        "frequencies": [1.0, 2.5, 4.0, 6.5, 9.0],
+        "damping_coefficients": [0.1, 0.25, 0.4, 0.6, 0.8],
+        "integration_range": [0, 10],
+        "resolution": 2000
+    },
+
+    "analysis_requirements": {
+        "temporal_integral": "∫[0 to 10] c(ξ) * ψ(ξ) dξ",
+        "energy_distribution": "Calculate energy contribution of each component",
+        "convergence_metric": "Evaluate c(ξ) = exp(-ξ²) at critical points"
+    }
+}
+
+SPECIFIC_FUNCTION_CASES = [
+    {"expression": "sin(ξ)", "range": [0, 2*np.pi], "expected": 0.0},
+    {"expression": "ξ^2", "range": [0, 1], "expected": 1/3},
+    {"expression": "exp(-ξ^2)", "range": [-5, 5], "expected": np.sqrt(np.pi)},
+    {"expression": "cos(2*π*ξ) * exp(-ξ)", "range": [0, 10], "description": "Damped oscillation"}
+]
+
+CACHE_TEST_PROBLEM = {
+    "expression": "sin(ξ) * exp(-ξ^2)",
+    "description": "Test function for cache performance"
+}
+
+OPTIMIZATION_PROBLEM = {
+    "problem_type": "convergence_optimization",
+    "description": "Find optimal ξ for maximum convergence coefficient c(ξ) = exp(-ξ²)"
+}
+
+MULTIMODAL_OPTIMIZATION_PROBLEM = {
+    "problem_type": "convergence_optimization",
+    "objective": "sin(2*π*ξ) * exp(-ξ^2/2) + 0.5*cos(4*π*ξ) * exp(-ξ^2/4)",
+    "bounds": [0.0, 5.0],
+    "starts": 256,
+    "description": "Global maximum of the wave_convergence ψ(ξ) among its local maxima"
+}
+
+MASS_TEMPORAL_PROBLEM = {
+    "problem_type": "mass_temporal",
+    "temporal_acceleration": 0.15,
+    "description": "Calculate mass from temporal acceleration using m = (ħ/c²) * (∂²ξ/∂t²)"
+}
+
+RESONANCE_PROBLEM = {
+    "problem_type": "resonance_calculation",
+    "parameters": {
+        "fine_structure_constant": 1/137.035999,
+        "temporal_mass": 0.0,
+        "energy_scale": 1.956e9
+    }
+}
+
+TEMPORAL_DECAY_PROBLEM = {
+    "system_id": "TDS-42",
+    "resonance_readings": [
+        [0.15, 0.22, 0.18, 0.31, 0.29, 0.24, 0.19, 0.26],
+        [0.18, 0.25, 0.21, 0.28, 0.32, 0.27, 0.23, 0.30],
+        [0.22, 0.29, 0.25, 0.34, 0.36, 0.31, 0.28, 0.33],
+        [0.26, 0.33, 0.30, 0.37, 0.39, 0.35, 0.32, 0.37],
+        [0.31, 0.38, 0.35, 0.41, 0.43, 0.39, 0.36, 0.41]
+    ],
+    "time_intervals": [0, 2.5, 5.0, 7.5, 10.0],
+    "decay_equation": "∂²ξ/∂t² + 0.15 * sin(2π * 587000 * t) * ξ = 0.05 * exp(-0.1*t)",
+    "critical_threshold": 0.75,
+    "prediction_horizon": 15.0
+}
+
+# Every solve request the suite sends, keyed by a short label.
+# "timeout" is the client timeout the originating test uses.
+PROBLEMS: Dict[str, Dict[str, Any]] = {
+    "mathematical": {
+        "problem_data": BASIC_MATHEMATICAL_PROBLEM,
+        "problem_type": "mathematical",
+        "timeout": 30
+    },
+    "wave_convergence": {
+        "problem_data": WAVE_CONVERGENCE_PROBLEM,
+        "problem_type": "mathematical",
+        "timeout": 45
+    },
+    "advanced_mathematical": {
+        "problem_data": ADVANCED_MATHEMATICAL_PROBLEM,
+        "problem_type": "mathematical",
+        "timeout": 60
+    },
+    "specific_sin": {
+        "problem_data": SPECIFIC_FUNCTION_CASES[0],
+        "problem_type": "mathematical",
+        "timeout": 20
+    },
+    "specific_square": {
+        "problem_data": SPECIFIC_FUNCTION_CASES[1],
+        "problem_type": "mathematical",
+        "timeout": 20
+    },
+    "specific_gaussian": {
+        "problem_data": SPECIFIC_FUNCTION_CASES[2],
+        "problem_type": "mathematical",
+        "timeout": 20
+    },
+    "specific_damped": {
+        "problem_data": SPECIFIC_FUNCTION_CASES[3],
+        "problem_type": "mathematical",
+        "timeout": 20
+    },
+    "cache_expression": {
+        "problem_data": CACHE_TEST_PROBLEM,
+        "problem_type": "mathematical",
+        "timeout": 20
+    },
+    "mass_temporal": {
+        "problem_data": MASS_TEMPORAL_PROBLEM,
+        "problem_type": "physics",
+        "timeout": 20
+    },
+    "resonance_calculation": {
+        "problem_data": RESONANCE_PROBLEM,
+        "problem_type": "physics",
+        "timeout": 20
+    },
+    "temporal_decay": {
+        "problem_data": TEMPORAL_DECAY_PROBLEM,
+        "problem_type": "physics",
+        "timeout": 30
+    },
+    "optimization": {
+        "problem_data": OPTIMIZATION_PROBLEM,
+        "problem_type": "optimization",
+        "timeout": 20
+    },
+    "multimodal_optimization": {
+        "problem_data": MULTIMODAL_OPTIMIZATION_PROBLEM,
+        "problem_type": "optimization",
+        "timeout": 20
+    }
+}
+
+# problem_data fields holding ξ-expressions, canonicalized before hashing
+EXPRESSION_FIELDS = ("expression", "wave_function", "objective")
+
+
+def problem_names() -> List[str]:
+    """Return the labels of every problem in the catalog"""
+    return list(PROBLEMS)
+
+
+def solve_payload(name: str) -> Dict[str, Any]:
+    """Return a fresh /api/v1/solve request body for a catalog problem"""
+    entry = PROBLEMS[name]
+    return {
+        "problem_data": copy.deepcopy(entry["problem_data"]),
+        "problem_type": entry["problem_type"]
+    }
+
+
+def canonical_problem(problem_data: Any, field: str = None) -> Any:
+    """problem_data with expression fields and numbers in canonical form
+
+    Formulations that differ only in notation, the order of sum and product
+    operands, how a negated sum is written, or float formatting beyond
+    CANONICAL_DIGITS come out identical, so they hash to the same
+    problem_hash. Numbers are rounded the same way in scalars, short lists and
+    large arrays, and NumPy scalars become plain Python numbers.
+    """
+    if isinstance(problem_data, np.ndarray) and problem_data.ndim == 0:
+        problem_data = problem_data.item()
+    if isinstance(problem_data, dict):
+        return {key: canonical_problem(value, key) for key, value in problem_data.items()}
+    if isinstance(problem_data, (list, tuple, np.ndarray)):
+        array = numeric_array(problem_data)
+        if array is not None:
+            # Large arrays hash by content, the same whether sent as JSON lists or binary
+            array = np.ascontiguousarray(canonical_numbers(array))
+            return {"ndarray": list(array.shape), "sha256": hashlib.sha256(array).hexdigest()}
+        return [canonical_problem(value) for value in problem_data]
+    if isinstance(problem_data, (bool, np.bool_)) or problem_data is None:
+        return problem_data if problem_data is None else bool(problem_data)
+    if isinstance(problem_data, (int, float, np.integer, np.floating)):
+        return canonical_number(problem_data)
+    if isinstance(problem_data, str) and field in EXPRESSION_FIELDS:
+        try:
+            return canonical_expression(problem_data)
+        except ExpressionError:
+            return problem_data
+    return problem_data
+
+
+def problem_hash(problem_data: Any, problem_type: str) -> str:
+    """SHA-256 of the canonical JSON form of a solve request"""
+    canonical = json.dumps({"problem_data": canonical_problem(problem_data), "problem_type": problem_type},
+                           sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
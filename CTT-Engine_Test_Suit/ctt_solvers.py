@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+NumPy reference solvers for the problem types served by the CTT stand-in engine
+"""
+
+import threading
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+import multistart
+import quadrature
+from fourier_engine import FourierDecomposition, convergence_coefficient
+from parameter_sweep import wave_convergence_sweep
+from temporal_decay import predict_decay
+from xi_expression import ExpressionError, compile_expression
+
+HBAR = 1.054571817e-34          # J·s
+SPEED_OF_LIGHT = 299792458.0    # m/s
+
+# Largest broadcast result of array-valued physics parameters (float64 elements)
+MAX_BROADCAST_ELEMENTS = 1 << 24
+DEFAULT_RANGE = [-5.0, 5.0]
+DEFAULT_RESOLUTION = 2001
+# Largest grid a request may ask for through "resolution"
+MAX_RESOLUTION = 10 ** 7
+# ξ_points of a convergence sweep, its frequency × damping cells, and the
+# cells × ξ_points integrand evaluations one request may cost
+MAX_XI_POINTS = 10 ** 5
+MAX_SWEEP_CELLS = 10 ** 6
+MAX_SWEEP_EVALUATIONS = 5 * 10 ** 7
+DEFAULT_EPSABS = 1e-10
+DEFAULT_EPSREL = 1e-10
+
+
+class ProblemError(ValueError):
+    """Raised when problem_data cannot be solved by the stand-in engine"""
+
+
+_hooks = threading.local()
+
+
+@contextmanager
+def progress_hook(callback: Callable[[float, Optional[Dict[str, Any]]], None]):
+    """Route report_progress calls made by solvers on this thread to callback(fraction, partial)
+
+    The callback may raise to abort the solve, e.g. when its job was cancelled.
+    """
+    previous = getattr(_hooks, "progress", None)
+    _hooks.progress = callback
+    try:
+        yield
+    finally:
+        _hooks.progress = previous
+
+
+def report_progress(fraction: float, partial: Optional[Dict[str, Any]] = None):
+    """Report the completed fraction of a solve and any partial solution so far"""
+    callback = getattr(_hooks, "progress", None)
+    if callback is not None:
+        callback(fraction, partial)
+
+
+@contextmanager
+def chunk_hook(callback: Callable[[str, Dict[str, Any]], None]):
+    """Route emit_chunk calls made by solvers on this thread to callback(field, data)
+
+    Solvers emit intermediate results as they are produced: convergence_grid
+    slices, Fourier analysis blocks and quadrature convergence rounds. A
+    chunk whose data has "append" or "set" carries solution fields: lists to
+    extend, or values that the next such chunk replaces, final in the last.
+    """
+    previous = getattr(_hooks, "chunk", None)
+    _hooks.chunk = callback
+    try:
+        yield
+    finally:
+        _hooks.chunk = previous
+
+
+def emit_chunk(field: str, data: Dict[str, Any]):
+    callback = getattr(_hooks, "chunk", None)
+    if callback is not None:
+        callback(field, data)
+
+
+def _streaming() -> bool:
+    return getattr(_hooks, "chunk", None) is not None
+
+
+def _convergence_rounds() -> Optional[Callable[[float, float, int, int], None]]:
+    """quadrature on_round callback emitting 'convergence' chunks, if anyone listens"""
+    if not _streaming():
+        return None
+    return lambda integral, error, evaluations, intervals: emit_chunk("convergence", {
+        "integral": integral, "error_estimate": error,
+        "evaluations": evaluations, "intervals": intervals
+    })
+
+
+def _resolution(value: Any, limit: int = MAX_RESOLUTION, name: str = "resolution") -> int:
+    resolution = int(value)
+    if not 2 <= resolution <= limit:
+        raise ProblemError(f"{name} must be between 2 and {limit}, got {resolution}")
+    return resolution
+
+
+def _grid(integration_range: List[float], resolution: int) -> np.ndarray:
+    lower, upper = (float(v) for v in integration_range)
+    if not upper > lower:
+        raise ProblemError(f"Invalid integration range {integration_range}")
+    return np.linspace(lower, upper, _resolution(resolution))
+
+
+def integrate_expression(expression: str, integration_range: List[float],
+                         resolution: Optional[int] = None, epsabs: float = DEFAULT_EPSABS,
+                         epsrel: float = DEFAULT_EPSREL) -> Dict[str, Any]:
+    """Integrate a ξ-expression over a range
+
+    Uses adaptive Gauss–Kronrod quadrature to the requested tolerance, or the
+    trapezoid rule on a uniform grid when an explicit resolution is given.
+    """
+    function = compile_expression(expression)
+    lower, upper = _grid(integration_range, 2)
+    solution = {"expression": expression, "integration_range": [float(lower), float(upper)]}
+    if resolution is not None:
+        xi = _grid(integration_range, resolution)
+        solution.update({
+            "integral": float(np.trapezoid(function(xi), xi)),
+            "evaluations": int(xi.size),
+            "method": "trapezoid"
+        })
+    else:
+        solution.update(quadrature.integrate(function, lower, upper, epsabs, epsrel,
+                                             on_round=_convergence_rounds()).as_dict())
+        solution["method"] = "gauss_kronrod_15"
+    if not np.isfinite(solution["integral"]):
+        raise ProblemError(f"Integrand {expression} is not finite over {solution['integration_range']}")
+    return solution
+
+
+def _section(problem: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """problem[key] as an object, {} when absent"""
+    section = problem.get(key, {})
+    if not isinstance(section, dict):
+        raise ProblemError(f"{key} must be an object, got {type(section).__name__}")
+    return section
+
+
+def _tolerances(problem: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        "epsabs": float(problem.get("epsabs", DEFAULT_EPSABS)),
+        "epsrel": float(problem.get("epsrel", DEFAULT_EPSREL))
+    }
+
+
+def solve_wave_convergence(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Integrate the wave function and its (frequency × damping) convergence grid"""
+    analysis = _section(problem, "convergence_analysis")
+    integration_range = problem.get("integration_range", DEFAULT_RANGE)
+    solution = integrate_expression(problem["wave_function"], integration_range,
+                                    **_tolerances(analysis))
+
+    if len(analysis.get("frequency_components", [])) and len(analysis.get("damping_factors", [])):
+        xi_points = _resolution(analysis.get("ξ_points", 1000), MAX_XI_POINTS, "ξ_points")
+        cells = len(analysis["frequency_components"]) * len(analysis["damping_factors"])
+        if cells > MAX_SWEEP_CELLS or cells * xi_points > MAX_SWEEP_EVALUATIONS:
+            raise ProblemError(f"Convergence sweep of {cells} cells × {xi_points} ξ_points exceeds "
+                               f"{MAX_SWEEP_CELLS} cells or {MAX_SWEEP_EVALUATIONS} evaluations")
+        report_progress(0.5, dict(solution))
+        sweep, function = wave_convergence_sweep(problem)
+        on_unit = None
+        if _streaming():
+            # A header with the axes, then one slice of flat grid values per sweep unit
+            axes = {name: labels.tolist() for name, labels in sweep.axes.items()}
+            emit_chunk("convergence_grid", {"axes": axes, "shape": list(sweep.shape)})
+
+            def on_unit(start, stop, values):
+                emit_chunk("convergence_grid", {"start": start, "stop": stop, "values": values.tolist()})
+        solution["convergence_grid"] = sweep.run(
+            function, processes=0, progress=lambda fraction: report_progress(0.5 + 0.5 * fraction),
+            on_unit=on_unit
+        ).to_dict()
+    return solution
+
+
+def solve_advanced_mathematical(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Fourier-decomposition ψ(ξ) = Σ A_n sin(2π f_n ξ) exp(-α_n ξ²) with c(ξ) weighting"""
+    parameters = _section(problem, "parameters")
+    try:
+        psi = FourierDecomposition(parameters["amplitudes"], parameters["frequencies"],
+                                   parameters["damping_coefficients"])
+    except ValueError as e:
+        raise ProblemError(str(e))
+
+    lower, upper = _grid(parameters.get("integration_range", [0, 10]), 2)
+    resolution = _resolution(parameters.get("resolution", DEFAULT_RESOLUTION))
+    on_block = None
+    if _streaming():
+        def on_block(block):
+            energies = np.asarray(block["component_energies"])
+            total_energy = energies.sum()
+            emit_chunk("analysis", {
+                "xi_range": block["xi_range"],
+                "append": {
+                    "critical_points": block["critical_points"],
+                    "convergence_at_critical_points":
+                        convergence_coefficient(np.asarray(block["critical_points"])).tolist()
+                },
+                "set": {
+                    "temporal_integral_grid": block["weighted_integral"],
+                    "component_energies": block["component_energies"],
+                    "energy_distribution": (energies / total_energy if total_energy else energies).tolist(),
+                    "critical_point_count": block["critical_point_count"]
+                }
+            })
+    analysis = psi.analyze(lower, upper, resolution, on_block=on_block)
+    report_progress(0.5, {"problem_id": problem.get("problem_id"),
+                          "temporal_integral_grid": analysis["weighted_integral"],
+                          "energy_distribution": analysis["energy_distribution"]})
+    temporal = quadrature.integrate(lambda xi: convergence_coefficient(xi) * psi.evaluate(xi),
+                                    lower, upper, **_tolerances(parameters),
+                                    on_round=_convergence_rounds())
+
+    return {
+        "problem_id": problem.get("problem_id"),
+        "temporal_integral": temporal.integral,
+        "temporal_integral_error": temporal.error,
+        "temporal_integral_evaluations": temporal.evaluations,
+        "temporal_integral_grid": analysis["weighted_integral"],
+        "energy_distribution": analysis["energy_distribution"],
+        "component_energies": analysis["component_energies"],
+        "critical_points": analysis["critical_points"],
+        "critical_point_count": analysis["critical_point_count"],
+        "convergence_at_critical_points": analysis["weight_at_critical_points"],
+        "evaluations": analysis["evaluations"]
+    }
+
+
+def solve_mathematical(problem: Any) -> Dict[str, Any]:
+    """Dispatch a mathematical problem on its inner problem_type"""
+    if isinstance(problem, str):
+        return integrate_expression(problem, DEFAULT_RANGE)
+    if not isinstance(problem, dict):
+        raise ProblemError("problem_data must be an expression string or an object")
+
+    inner_type = problem.get("problem_type")
+    if inner_type == "wave_convergence":
+        return solve_wave_convergence(problem)
+    if inner_type == "advanced_mathematical":
+        return solve_advanced_mathematical(problem)
+    if "expression" in problem:
+        return integrate_expression(problem["expression"],
+                                    problem.get("range", DEFAULT_RANGE),
+                                    problem.get("resolution"),
+                                    **_tolerances(problem))
+    raise ProblemError(f"Unsupported mathematical problem '{inner_type}'")
+
+
+def _broadcast_parameters(**parameters: Any) -> Tuple[Dict[str, np.ndarray], Tuple[int, ...]]:
+    """Parameters as float arrays and the shape they broadcast to under NumPy rules
+
+    Scalars broadcast to shape (); lists and arrays of any shape combine
+    like NumPy operands, e.g. a (n, 1) column against a (m,) row gives n × m
+    parameter combinations.
+    """
+    arrays = {name: np.asarray(value, dtype=float) for name, value in parameters.items()}
+    try:
+        shape = np.broadcast_shapes(*(array.shape for array in arrays.values()))
+    except ValueError:
+        shapes = {name: list(array.shape) for name, array in arrays.items()}
+        raise ProblemError(f"Parameter shapes {shapes} do not broadcast together")
+    if int(np.prod(shape)) > MAX_BROADCAST_ELEMENTS:
+        raise ProblemError(f"Parameters broadcast to {list(shape)}, more than "
+                           f"{MAX_BROADCAST_ELEMENTS} combinations")
+    return arrays, shape
+
+
+def solve_mass_temporal(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Mass from temporal acceleration, m = (ħ/c²) · ∂²ξ/∂t²
+
+    An array of accelerations is evaluated in one pass and answered with
+    mass_kg as an array of the same shape.
+    """
+    arrays, shape = _broadcast_parameters(temporal_acceleration=problem["temporal_acceleration"])
+    mass = HBAR / SPEED_OF_LIGHT ** 2 * arrays["temporal_acceleration"]
+    if shape == ():
+        return {
+            "temporal_acceleration": float(arrays["temporal_acceleration"]),
+            "mass_kg": float(mass)
+        }
+    return {"shape": list(shape), "mass_kg": mass}
+
+
+def solve_resonance(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Resonance frequency f = α · E / (2π) shifted by the temporal mass, f · sqrt(1 + m)
+
+    The three parameters may be arrays; they broadcast against each other and
+    the frequencies come back as arrays of the broadcast shape.
+    """
+    parameters = _section(problem, "parameters")
+    arrays, shape = _broadcast_parameters(
+        fine_structure_constant=parameters["fine_structure_constant"],
+        energy_scale=parameters["energy_scale"],
+        temporal_mass=parameters.get("temporal_mass", 0.0))
+    frequency = arrays["fine_structure_constant"] * arrays["energy_scale"] / (2 * np.pi)
+    if arrays["temporal_mass"].any():
+        frequency = frequency * np.sqrt(1.0 + arrays["temporal_mass"])
+    frequency = np.broadcast_to(frequency, shape)
+    if shape == ():
+        return {
+            "resonance_frequency_hz": float(frequency),
+            "angular_frequency": float(2 * np.pi * frequency)
+        }
+    return {
+        "shape": list(shape),
+        "resonance_frequency_hz": frequency,
+        "angular_frequency": 2 * np.pi * frequency
+    }
+
+
+def solve_temporal_decay(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Predict every resonance channel to the horizon and flag threshold crossings
+
+    Problems with a decay_equation are integrated with the reference ODE
+    integrator; otherwise each channel's linear trend is extrapolated.
+    """
+    if "decay_equation" in problem:
+        try:
+            solution = predict_decay(problem, progress=report_progress)
+        except ValueError as e:
+            raise ProblemError(str(e))
+        solution["system_id"] = problem.get("system_id")
+        return solution
+
+    readings = np.asarray(problem["resonance_readings"], dtype=float)      # (T, channels)
+    times = np.asarray(problem["time_intervals"], dtype=float)
+    if readings.ndim != 2 or times.ndim != 1 or readings.shape[0] != times.size:
+        raise ProblemError("resonance_readings needs one row per entry of time_intervals")
+    if times.size < 2:
+        raise ProblemError("time_intervals needs at least two entries to fit each channel's line")
+    threshold = float(problem.get("critical_threshold", 1.0))
+    horizon = float(problem.get("prediction_horizon", times[-1]))
+
+    slope, intercept = np.polyfit(times, readings, 1)
+    predicted = slope * horizon + intercept
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = np.where(slope > 0, (threshold - intercept) / slope, np.inf)
+    crossing = np.where(crossing <= horizon, np.maximum(crossing, times[0]), np.inf)
+
+    return {
+        "system_id": problem.get("system_id"),
+        "predicted_readings": predicted.tolist(),
+        "channels_over_threshold": np.flatnonzero(np.isfinite(crossing)).tolist(),
+        "threshold_crossing_times": [float(t) if np.isfinite(t) else None for t in crossing],
+        "critical_threshold": threshold,
+        "prediction_horizon": horizon
+    }
+
+
+def solve_physics(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch a physics problem on its inner problem_type"""
+    if not isinstance(problem, dict):
+        raise ProblemError("physics problem_data must be an object")
+    inner_type = problem.get("problem_type")
+    if inner_type == "mass_temporal":
+        return solve_mass_temporal(problem)
+    if inner_type == "resonance_calculation":
+        return solve_resonance(problem)
+    if "resonance_readings" in problem:
+        return solve_temporal_decay(problem)
+    raise ProblemError(f"Unsupported physics problem '{inner_type}'")
+
+
+def solve_convergence_optimization(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Maximize an objective over ξ within bounds
+
+    The default method runs the vectorized multi-start search of multistart.py
+    (starts, max_iterations, tolerance and seed are optional); "goal":
+    "minimize" flips the objective. method "grid" keeps the single grid search
+    refined with a parabolic step.
+    """
+    if problem.get("method", "multistart") == "grid":
+        return _grid_optimization(problem)
+    objective = problem.get("objective", "exp(-ξ^2)")
+    lower, upper = (float(bound) for bound in problem.get("bounds", DEFAULT_RANGE))
+    function = compile_expression(objective)
+    minimize = problem.get("goal", "maximize") == "minimize"
+    max_iterations = int(problem.get("max_iterations", multistart.DEFAULT_MAX_ITERATIONS))
+
+    def on_iteration(iteration, xi, value, active):
+        report_progress(iteration / max_iterations,
+                        {"optimal_xi": xi, "optimal_value": -value if minimize else value,
+                         "active_starts": active})
+
+    try:
+        result = multistart.maximize((lambda xi: -function(xi)) if minimize else function, lower, upper,
+                                     int(problem.get("starts", multistart.DEFAULT_STARTS)), max_iterations,
+                                     float(problem.get("tolerance", multistart.DEFAULT_XTOL)),
+                                     int(problem.get("seed", 0)), on_iteration)
+    except ValueError as e:
+        raise ProblemError(str(e))
+    if not np.isfinite(result.value):
+        raise ProblemError("objective is not finite anywhere in bounds")
+    solution = {"objective": objective, **result.as_dict(), "method": "multistart"}
+    if minimize:
+        solution["optimal_value"] = -solution["optimal_value"]
+        solution["local_optima"] = [[xi, -value] for xi, value in solution["local_optima"]]
+    return solution
+
+
+def _grid_optimization(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Grid search refined with a parabolic step"""
+    objective = problem.get("objective", "exp(-ξ^2)")
+    bounds = problem.get("bounds", DEFAULT_RANGE)
+    xi = _grid(bounds, problem.get("resolution", 10001))
+    values = compile_expression(objective)(xi)
+    best = int(np.argmax(values))
+
+    optimum = xi[best]
+    if 0 < best < xi.size - 1:
+        left, centre, right = values[best - 1:best + 2]
+        curvature = left - 2 * centre + right
+        if curvature < 0:
+            optimum += 0.5 * (left - right) / curvature * (xi[1] - xi[0])
+
+    return {
+        "objective": objective,
+        "optimal_xi": float(optimum),
+        "optimal_value": float(compile_expression(objective)(np.asarray([optimum]))[0]),
+        "evaluations": int(xi.size) + 1,
+        "method": "grid"
+    }
+
+
+def solve_optimization(problem: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch an optimization problem on its inner problem_type"""
+    if not isinstance(problem, dict):
+        raise ProblemError("optimization problem_data must be an object")
+    inner_type = problem.get("problem_type", "convergence_optimization")
+    if inner_type == "convergence_optimization":
+        return solve_convergence_optimization(problem)
+    raise ProblemError(f"Unsupported optimization problem '{inner_type}'")
+
+
+SOLVERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "mathematical": solve_mathematical,
+    "physics": solve_physics,
+    "optimization": solve_optimization
+}
+
+
+def solve(problem_data: Any, problem_type: str) -> Dict[str, Any]:
+    """Solve one problem, raising ProblemError for anything the stand-in cannot handle"""
+    solver = SOLVERS.get(problem_type)
+    if solver is None:
+        raise ProblemError(f"Unsupported problem_type '{problem_type}', expected one of {list(SOLVERS)}")
+    try:
+        return solver(problem_data)
+    except ProblemError:
+        raise
+    except ExpressionError as e:
+        raise ProblemError(str(e))
+    except (MemoryError, OverflowError) as e:
+        raise ProblemError(f"Problem too large: {e!r}")
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+        # Well-typed JSON in the wrong shape (a list where an object belongs, an empty list)
+        raise ProblemError(f"Malformed {problem_type} problem: {e!r}")
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the CTT engine API, backed by the NumPy reference solvers
+
+Serves /api/v1/health, /api/v1/equations, /api/v1/solve, /api/v1/solve/batch,
+/api/v1/stats, /api/v1/clear and the /api/v1/jobs job API (submit, poll,
+cancel; see ctt_jobs.py) with the response shape the test suite reads,
+so the suite and its benchmarks run without the real engine:
+
+    python ctt_stand_in_server.py --port 8000
+
+/api/v1/solve also negotiates the binary array transport of ctt_binary.py,
+and with Accept: application/x-ndjson streams intermediate results as they
+are produced (see CTTRequestHandler.stream_solve).
+
+Every response carries a Server-Timing header with the request's recv, decode,
+queue, compute and encode phases (see ctt_tracing.py), and the solve phases
+aggregate into histograms served at /api/v1/metrics in Prometheus text, or as
+JSON with ?format=json.
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+import ctt_solvers
+from ctt_binary import BINARY_CONTENT_TYPE, decode_body, encode_binary, pack_arrays
+from ctt_jobs import DEFAULT_WORKERS, JobManager
+from ctt_problems import problem_hash
+from ctt_solvers import ProblemError
+from ctt_tracing import SERVER_TIMING_HEADER, PhaseTimer, TraceRecorder, format_server_timing
+
+ENGINE_VERSION = "stand-in-1.0"
+MAX_BATCH_SIZE = 1000
+JOBS_PREFIX = "/api/v1/jobs/"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+# Routes whose phase timings are aggregated for /api/v1/metrics
+TRACED_ROUTES = ("/api/v1/solve", "/api/v1/solve/batch")
+
+CTT_EQUATIONS = [
+    {"name": "convergence_coefficient", "equation": "c(ξ) = exp(-ξ²)"},
+    {"name": "mass_temporal", "equation": "m = (ħ/c²) * (∂²ξ/∂t²)"},
+    {"name": "resonance_frequency", "equation": "f = α * E / (2π) * sqrt(1 + m)"},
+    {"name": "fourier_decomposition", "equation": "ψ(ξ) = Σ A_n * sin(2π*f_n*ξ) * exp(-α_n*ξ²)"},
+    {"name": "temporal_integral", "equation": "∫ c(ξ) * ψ(ξ) dξ"},
+    {"name": "temporal_decay", "equation": "∂²ξ/∂t² + k * sin(2π * f * t) * ξ = F(t)"}
+]
+
+
+def _json_default(value: Any) -> Any:
+    # Arrays decoded from binary requests may be echoed back in a solution
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class CTTStandInEngine:
+    """Solve dispatcher with an LRU result cache keyed on problem_hash"""
+
+    def __init__(self, cache_size: int = 1024):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_problems_solved = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def solve(self, problem_data: Any, problem_type: str) -> Dict[str, Any]:
+        """Solve a problem (or serve it from cache) and build the API response"""
+        start = time.perf_counter()
+        try:
+            key = problem_hash(problem_data, problem_type)
+        except (MemoryError, OverflowError) as e:
+            raise ProblemError(f"Problem too large: {e!r}")
+        except (TypeError, ValueError, RecursionError) as e:
+            raise ProblemError(f"Malformed {problem_type} problem: {e!r}")
+
+        with self._lock:
+            solution = self._cache.get(key)
+            if solution is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+
+        if solution is None:
+            solution = ctt_solvers.solve(problem_data, problem_type)
+            with self._lock:
+                self.cache_misses += 1
+                if self.cache_size > 0:
+                    self._cache[key] = solution
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        with self._lock:
+            self.total_problems_solved += 1
+        return {
+            "solution": solution,
+            "problem_hash": key,
+            "computation_time": time.perf_counter() - start,
+            "status": "success"
+        }
+
+    def solve_batch(self, problems: List[Any]) -> Dict[str, Any]:
+        """Solve a list of {problem_data, problem_type} items, reporting status per item"""
+        start = time.perf_counter()
+        results = []
+        for item in problems:
+            if not isinstance(item, dict) or "problem_data" not in item:
+                results.append({"status": "error", "error": "Missing problem_data"})
+                continue
+            try:
+                results.append(self.solve(item["problem_data"], item.get("problem_type", "mathematical")))
+            except ProblemError as e:
+                results.append({"status": "error", "error": str(e)})
+            except (MemoryError, OverflowError) as e:
+                results.append({"status": "error", "error": f"Problem too large: {e!r}"})
+            except Exception as e:
+                # One item's unexpected failure must not cost the other items their results
+                results.append({"status": "error", "error": f"Internal error: {e!r}"})
+        return {
+            "results": results,
+            "computation_time": time.perf_counter() - start,
+            "status": "success"
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_problems_solved": self.total_problems_solved,
+                "memory_usage_entries": len(self._cache),
+                "cache_capacity": self.cache_size,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "status": "operational",
+                "technology": "CTT stand-in (NumPy reference solvers)"
+            }
+
+    def clear(self) -> int:
+        with self._lock:
+            cleared = len(self._cache)
+            self._cache.clear()
+        return cleared
+
+
+class CTTRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler for the CTT API routes"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"CTTStandIn/{ENGINE_VERSION}"
+    disable_nagle_algorithm = True
+
+    def parse_request(self) -> bool:
+        # Called once per request on a keep-alive connection, right after its request line
+        self.timer = PhaseTimer()
+        return super().parse_request()
+
+    def send_json(self, status: int, payload: Any):
+        body = json.dumps(payload, default=_json_default).encode("utf-8")
+        self.timer.mark("encode")
+        self.send_body(status, body, "application/json")
+
+    def send_binary(self, status: int, payload: Any):
+        body, content_type = encode_binary(pack_arrays(payload))
+        self.timer.mark("encode")
+        self.send_body(status, body, content_type)
+
+    def send_body(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header(SERVER_TIMING_HEADER, format_server_timing(self.timer.timings))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def timed_solve(self, solve, *args) -> Any:
+        """Run solve(*args) in a free solve slot, timing the wait as queue and the solve as compute"""
+        slots = self.server.solve_slots
+        if slots is not None:
+            slots.acquire()
+        self.timer.mark("queue")
+        try:
+            return solve(*args)
+        finally:
+            self.timer.mark("compute")
+            if slots is not None:
+                slots.release()
+
+    def send_unexpected_error(self, error: Exception):
+        # Anything a solver did not anticipate still gets a JSON answer on a live connection
+        if isinstance(error, (MemoryError, OverflowError)):
+            self.send_json(400, {"status": "error", "error": f"Problem too large: {error!r}"})
+            return
+        self.log_error("Internal error on %s: %r", self.path, error)
+        self.send_json(500, {"status": "error", "error": f"Internal error: {error!r}"})
+
+    def accepts_binary(self) -> bool:
+        return BINARY_CONTENT_TYPE in self.headers.get("Accept", "")
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self):
+        engine = self.server.engine
+        if urlsplit(self.path).path == "/api/v1/metrics":
+            self.handle_metrics()
+        elif self.path == "/api/v1/health":
+            self.send_json(200, {
+                "status": "healthy",
+                "engine_ready": True,
+                "version": ENGINE_VERSION,
+                "timestamp": datetime.now().isoformat(timespec="seconds")
+            })
+        elif self.path == "/api/v1/equations":
+            self.send_json(200, {"equations": CTT_EQUATIONS})
+        elif self.path == "/api/v1/stats":
+            self.send_json(200, {**engine.stats(), "jobs": self.server.jobs.stats()})
+        elif self.path.startswith(JOBS_PREFIX):
+            job = self.server.jobs.get(self.path[len(JOBS_PREFIX):])
+            if job is None:
+                self.send_json(404, {"status": "error", "error": f"Unknown job {self.path}"})
+            else:
+                self.send_json(200, job.to_dict())
+        else:
+            self.send_json(404, {"status": "error", "error": f"Unknown route {self.path}"})
+
+    def do_POST(self):
+        routes = {
+            "/api/v1/solve": self.handle_solve,
+            "/api/v1/solve/batch": self.handle_solve_batch,
+            "/api/v1/clear": self.handle_clear,
+            "/api/v1/jobs": self.handle_submit_job,
+            "/api/v1/jobs/status": self.handle_job_statuses
+        }
+        body = self.read_body()
+        self.timer.mark("recv")
+        handler = routes.get(self.path)
+        if handler is None:
+            self.send_json(404, {"status": "error", "error": f"Unknown route {self.path}"})
+            return
+        try:
+            request = decode_body(body, self.headers.get("Content-Type", ""))
+        except ValueError as e:
+            self.send_json(400, {"status": "error", "error": f"Invalid request body: {e}"})
+            return
+        self.timer.mark("decode")
+        handler(request)
+        if self.path in TRACED_ROUTES:
+            self.timer.mark("send")
+            self.server.tracer.record({**self.timer.timings, "total": self.timer.total()})
+
+    def do_DELETE(self):
+        self.read_body()
+        if not self.path.startswith(JOBS_PREFIX):
+            self.send_json(404, {"status": "error", "error": f"Unknown route {self.path}"})
+            return
+        job = self.server.jobs.cancel(self.path[len(JOBS_PREFIX):])
+        if job is None:
+            self.send_json(404, {"status": "error", "error": f"Unknown job {self.path}"})
+        else:
+            self.send_json(200, job.to_dict())
+
+    def handle_submit_job(self, request: Any):
+        if not isinstance(request, dict) or "problem_data" not in request:
+            self.send_json(400, {"status": "error", "error": "Missing problem_data"})
+            return
+        job = self.server.jobs.submit(request["problem_data"], request.get("problem_type", "mathematical"))
+        self.send_json(202, {**job.to_dict(), "status_url": JOBS_PREFIX + job.job_id})
+
+    def handle_job_statuses(self, request: Any):
+        job_ids = request.get("job_ids") if isinstance(request, dict) else None
+        if not isinstance(job_ids, list):
+            self.send_json(400, {"status": "error", "error": "Missing job_ids list"})
+            return
+        self.send_json(200, {"jobs": self.server.jobs.statuses(job_ids)})
+
+    def handle_clear(self, request: Any):
+        cleared = self.server.engine.clear()
+        self.send_json(200, {
+            "status": "success",
+            "message": f"Cleared {cleared} entries from CTT memory",
+            "remaining_entries": 0
+        })
+
+    def handle_metrics(self):
+        query = parse_qs(urlsplit(self.path).query)
+        if query.get("format") == ["json"]:
+            self.send_json(200, {"phases": self.server.tracer.to_dict()})
+        else:
+            body = self.server.tracer.to_prometheus("ctt_server_phase_seconds").encode("utf-8")
+            self.timer.mark("encode")
+            self.send_body(200, body, PROMETHEUS_CONTENT_TYPE)
+
+    def handle_solve(self, request: Any):
+        if not isinstance(request, dict) or "problem_data" not in request:
+            self.send_json(400, {"status": "error", "error": "Missing problem_data"})
+            return
+        if NDJSON_CONTENT_TYPE in self.headers.get("Accept", ""):
+            self.stream_solve(request["problem_data"], request.get("problem_type", "mathematical"))
+            return
+        try:
+            response = self.timed_solve(self.server.engine.solve, request["problem_data"],
+                                        request.get("problem_type", "mathematical"))
+        except ProblemError as e:
+            self.send_json(400, {"status": "error", "error": str(e)})
+            return
+        except Exception as e:
+            self.send_unexpected_error(e)
+            return
+        if self.accepts_binary():
+            self.send_binary(200, response)
+        else:
+            self.send_json(200, response)
+
+    def stream_solve(self, problem_data: Any, problem_type: str):
+        """Solve with every chunk the solver emits sent at once as a chunked NDJSON line
+
+        Lines are {"type": "chunk", "field", ...} while solving, then one
+        {"type": "result", ...} line with the solve response, or a
+        {"type": "error"} line. Solution fields already delivered in full by
+        chunks are left out of the result line and listed in its
+        streamed_fields: convergence_grid, and the fields named under a chunk's
+        "append" (extend a list) or "set" (last value wins). A solve served
+        from the engine cache emits no chunks, so its result line carries the
+        whole solution and no streamed_fields. The Server-Timing header goes
+        out before the solve, so it only covers recv and decode.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", NDJSON_CONTENT_TYPE)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header(SERVER_TIMING_HEADER, format_server_timing(self.timer.timings))
+        self.end_headers()
+        streamed = set()
+
+        def write_line(payload: Dict[str, Any]):
+            line = json.dumps(payload, default=_json_default).encode("utf-8") + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+
+        def on_chunk(field: str, data: Dict[str, Any]):
+            streamed.add(field)
+            streamed.update(data.get("append", {}), data.get("set", {}))
+            write_line({"type": "chunk", "field": field, **data})
+
+        try:
+            with ctt_solvers.chunk_hook(on_chunk):
+                response = self.timed_solve(self.server.engine.solve, problem_data, problem_type)
+        except ProblemError as e:
+            write_line({"type": "error", "status": "error", "error": str(e)})
+        except OSError:
+            raise
+        except (MemoryError, OverflowError) as e:
+            write_line({"type": "error", "status": "error", "error": f"Problem too large: {e!r}"})
+        except Exception as e:
+            self.log_error("Internal error solving %s problem: %r", problem_type, e)
+            write_line({"type": "error", "status": "error", "error": f"Internal error: {e!r}"})
+        else:
+            solution = response["solution"]
+            omitted = sorted(streamed & set(solution)) if isinstance(solution, dict) else []
+            if omitted:
+                solution = {key: value for key, value in solution.items() if key not in omitted}
+            write_line({"type": "result", **response, "solution": solution, "streamed_fields": omitted})
+        self.wfile.write(b"0\r\n\r\n")
+
+    def handle_solve_batch(self, request: Any):
+        problems = request.get("problems") if isinstance(request, dict) else None
+        if not isinstance(problems, list):
+            self.send_json(400, {"status": "error", "error": "Missing problems list"})
+            return
+        if len(problems) > MAX_BATCH_SIZE:
+            self.send_json(400, {"status": "error",
+                                 "error": f"Batch of {len(problems)} exceeds {MAX_BATCH_SIZE} problems"})
+            return
+        try:
+            response = self.timed_solve(self.server.engine.solve_batch, problems)
+        except Exception as e:
+            self.send_unexpected_error(e)
+            return
+        self.send_json(200, response)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CTTStandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server owning one CTTStandInEngine"""
+
+    daemon_threads = True
+    # The stdlib default backlog of 5 drops SYNs when a client pool connects at once
+    request_queue_size = socket.SOMAXCONN
+
+    def __init__(self, address: Tuple[str, int], engine: Optional[CTTStandInEngine] = None,
+                 verbose: bool = False, job_workers: int = DEFAULT_WORKERS,
+                 max_solves: Optional[int] = None):
+        super().__init__(address, CTTRequestHandler)
+        self.engine = engine or CTTStandInEngine()
+        self.jobs = JobManager(self.engine, job_workers)
+        self.verbose = verbose
+        # Optional cap on concurrent synchronous solves; waiting for a slot is the queue phase
+        self.solve_slots = threading.BoundedSemaphore(max_solves) if max_solves else None
+        self.tracer = TraceRecorder()
+
+    def server_close(self):
+        self.jobs.shutdown()
+        super().server_close()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_background(host: str = "127.0.0.1", port: int = 0,
+                        engine: Optional[CTTStandInEngine] = None,
+                        max_solves: Optional[int] = None) -> CTTStandInServer:
+    """Start a stand-in server on a daemon thread; port 0 picks a free port"""
+    server = CTTStandInServer((host, port), engine, max_solves=max_solves)
+    thread = threading.Thread(target=server.serve_forever, name="ctt-stand-in", daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for the CTT engine API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="Solutions kept in the LRU cache (0 disables caching)")
+    parser.add_argument("--job-workers", type=int, default=DEFAULT_WORKERS,
+                        help="Threads solving submitted /api/v1/jobs")
+    parser.add_argument("--max-solves", type=int, default=None,
+                        help="Concurrent synchronous solves; further requests queue (default unlimited)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = CTTStandInServer((args.host, args.port), CTTStandInEngine(args.cache_size),
+                              args.verbose, args.job_workers, args.max_solves)
+    print(f"✓ CTT stand-in engine listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down CTT stand-in engine")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Per-phase latency tracing for solves, shared by the clients and the stand-in engine
+
+A solve is split into phases timed with time.perf_counter_ns:
+
+    client  acquire    waiting for a pooled connection (or opening one)
+            serialize  encoding the request body
+            upload     writing the request to the socket
+            wait       first response byte, i.e. server time plus network
+            download   reading the rest of the response
+            decode     parsing the response body
+    server  recv, decode, queue, compute, encode
+
+The server reports its phases in a standard Server-Timing header, so a client
+trace also carries server_* phases and the unexplained remainder of its wait
+as "network". Traces aggregate into log-bucketed histograms that export as
+JSON or Prometheus text.
+"""
+
+import threading
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+SERVER_TIMING_HEADER = "Server-Timing"
+# Histogram bucket upper bounds (seconds): 1 µs to ~190 s in steps of √2
+BUCKET_BOUNDS = 1e-6 * 2.0 ** (np.arange(55) / 2)
+SUMMARY_QUANTILES = [0.5, 0.9, 0.99]
+
+
+class PhaseTimer:
+    """Accumulates nanoseconds per phase; each mark() closes the phase since the previous mark"""
+
+    def __init__(self):
+        self.started = time.perf_counter_ns()
+        self.timings: Dict[str, int] = {}
+        self._last = self.started
+
+    def mark(self, phase: str):
+        now = time.perf_counter_ns()
+        self.timings[phase] = self.timings.get(phase, 0) + now - self._last
+        self._last = now
+
+    def total(self) -> int:
+        return time.perf_counter_ns() - self.started
+
+
+def format_server_timing(timings: Dict[str, int]) -> str:
+    """Server-Timing header value for phase timings in nanoseconds, e.g. 'compute;dur=1.250000'"""
+    return ", ".join(f"{phase};dur={ns / 1e6:.6f}" for phase, ns in timings.items())
+
+
+def parse_server_timing(value: str) -> Dict[str, int]:
+    """Phase timings in nanoseconds from a Server-Timing header value"""
+    timings = {}
+    for entry in (value or "").split(","):
+        name, *parameters = entry.strip().split(";")
+        for parameter in parameters:
+            key, _, duration = parameter.strip().partition("=")
+            if name and key == "dur":
+                try:
+                    timings[name] = int(float(duration) * 1e6)
+                except ValueError:
+                    pass
+    return timings
+
+
+def client_trace(timings: Dict[str, int], server_timing: Optional[str]) -> Dict[str, int]:
+    """Client phases merged with the server's, plus the network share of the client's wait"""
+    trace = dict(timings)
+    server = parse_server_timing(server_timing)
+    for phase, ns in server.items():
+        trace[f"server_{phase}"] = ns
+    if server and "wait" in trace:
+        trace["network"] = max(0, trace["wait"] - sum(server.values()))
+    return trace
+
+
+class LatencyHistogram:
+    """Cumulative-bucket histogram of durations in seconds"""
+
+    def __init__(self):
+        self.counts = np.zeros(BUCKET_BOUNDS.size + 1, dtype=np.int64)    # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[np.searchsorted(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Quantile estimated by interpolating within its bucket, clamped to the observed range"""
+        if self.count == 0:
+            return 0.0
+        cumulative = np.cumsum(self.counts)
+        rank = q * self.count
+        index = int(np.searchsorted(cumulative, rank))
+        lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+        upper = BUCKET_BOUNDS[index] if index < BUCKET_BOUNDS.size else self.max
+        below = cumulative[index - 1] if index > 0 else 0
+        fraction = (rank - below) / self.counts[index] if self.counts[index] else 0.0
+        return float(min(self.max, max(self.min, lower + fraction * (upper - lower))))
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary = {
+            "count": self.count,
+            "sum_s": self.sum,
+            "mean_ms": self.sum / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.min * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000
+        }
+        for q in SUMMARY_QUANTILES:
+            summary[f"p{q * 100:g}_ms"] = self.quantile(q) * 1000
+        nonzero = np.flatnonzero(self.counts)
+        cumulative = np.cumsum(self.counts)
+        if nonzero.size:
+            summary["buckets"] = [
+                [float(BUCKET_BOUNDS[i]) if i < BUCKET_BOUNDS.size else "+Inf", int(cumulative[i])]
+                for i in range(nonzero[0], nonzero[-1] + 1)
+            ]
+        return summary
+
+
+class TraceRecorder:
+    """Thread-safe per-phase histograms of solve traces"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, trace: Dict[str, int]):
+        """Add one trace of phase -> nanoseconds"""
+        with self._lock:
+            for phase, ns in trace.items():
+                histogram = self.histograms.get(phase)
+                if histogram is None:
+                    histogram = self.histograms[phase] = LatencyHistogram()
+                histogram.observe(ns / 1e9)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {phase: histogram.to_dict() for phase, histogram in self.histograms.items()}
+
+    def to_prometheus(self, metric: str = "ctt_solve_phase_seconds", labels: str = "") -> str:
+        """Prometheus text exposition of every phase histogram"""
+        extra = f",{labels}" if labels else ""
+        lines = [f"# HELP {metric} Latency of each solve phase",
+                 f"# TYPE {metric} histogram"]
+        with self._lock:
+            for phase, histogram in self.histograms.items():
+                cumulative = np.cumsum(histogram.counts)
+                for bound, total in zip(BUCKET_BOUNDS, cumulative):
+                    lines.append(f'{metric}_bucket{{phase="{phase}"{extra},le="{bound:.6g}"}} {total}')
+                lines.append(f'{metric}_bucket{{phase="{phase}"{extra},le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{phase="{phase}"{extra}}} {histogram.sum:.9f}')
+                lines.append(f'{metric}_count{{phase="{phase}"{extra}}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+def print_breakdown(summary: Dict[str, Any], phases: Optional[List[str]] = None):
+    """Print p50/p90/p99 per phase of a TraceRecorder.to_dict(), in the order solves go through them"""
+    order = ["serialize", "acquire", "upload", "wait", "server_recv", "server_decode",
+             "server_queue", "server_compute", "server_encode", "network", "download",
+             "decode", "total"]
+    phases = phases or [p for p in order if p in summary] + [p for p in summary if p not in order]
+    print(f"{'phase':<18}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}  (ms)")
+    for phase in phases:
+        s = summary[phase]
+        print(f"{phase:<18}{s['count']:>8}{s['mean_ms']:>10.3f}{s['p50_ms']:>10.3f}"
+              f"{s['p90_ms']:>10.3f}{s['p99_ms']:>10.3f}")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Broadcasted evaluation of ψ(ξ) = Σ A_n sin(2π f_n ξ) exp(-α_n ξ²)
+
+All N components are evaluated over a block of ξ as one (N × block) array.
+Blocks are sized so the two working buffers stay within a memory budget, so
+hundreds of components over millions of grid points stream through a fixed
+amount of memory. One pass over the grid yields ψ's c(ξ)-weighted integral,
+the energy of each component and the critical points of ψ.
+"""
+
+import numpy as np
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 ** 2     # bytes for the (N × block) buffers
+MAX_CRITICAL_POINTS = 1000
+
+
+def convergence_coefficient(xi: np.ndarray) -> np.ndarray:
+    """CTT convergence coefficient c(ξ) = exp(-ξ²)"""
+    return np.exp(-np.square(xi))
+
+
+class FourierDecomposition:
+    """Damped Fourier series defined by parallel amplitude/frequency/damping arrays"""
+
+    def __init__(self, amplitudes, frequencies, damping_coefficients,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        self.amplitudes = np.asarray(amplitudes, dtype=float)
+        self.frequencies = np.asarray(frequencies, dtype=float)
+        self.damping = np.asarray(damping_coefficients, dtype=float)
+        if not (self.amplitudes.ndim == 1
+                and self.amplitudes.shape == self.frequencies.shape == self.damping.shape):
+            raise ValueError("amplitudes, frequencies and damping_coefficients must be "
+                             "1-D arrays of equal length")
+        self.memory_budget = memory_budget
+        self._angular = 2 * np.pi * self.frequencies
+        self._neg_damping = -self.damping
+
+    @property
+    def components(self) -> int:
+        return self.amplitudes.size
+
+    def block_size(self) -> int:
+        """Grid points per block so two (N × block) float64 buffers fit the budget"""
+        return max(1, self.memory_budget // (2 * 8 * max(1, self.components)))
+
+    def _component_block(self, xi: np.ndarray, phase: np.ndarray, envelope: np.ndarray) -> np.ndarray:
+        # phase and envelope are preallocated (N × len(xi)) buffers, filled in place
+        np.multiply.outer(self._angular, xi, out=phase)
+        np.sin(phase, out=phase)
+        np.multiply.outer(self._neg_damping, np.square(xi), out=envelope)
+        np.exp(envelope, out=envelope)
+        phase *= envelope
+        phase *= self.amplitudes[:, None]
+        return phase
+
+    def _blocks(self, xi: np.ndarray) -> Iterator[Tuple[slice, np.ndarray]]:
+        block = min(self.block_size(), xi.size)
+        phase = np.empty((self.components, block))
+        envelope = np.empty((self.components, block))
+        for start in range(0, xi.size, block):
+            stop = min(start + block, xi.size)
+            width = stop - start
+            yield slice(start, stop), self._component_block(
+                xi[start:stop], phase[:, :width], envelope[:, :width])
+
+    def evaluate(self, xi) -> np.ndarray:
+        """ψ over an array of ξ of any shape, in memory-bounded blocks"""
+        xi = np.asarray(xi, dtype=float)
+        flat = xi.reshape(-1)
+        psi = np.empty_like(flat)
+        for window, components in self._blocks(flat):
+            psi[window] = components.sum(axis=0)
+        return psi.reshape(xi.shape)
+
+    def analyze(self, lower: float, upper: float, resolution: int,
+                weight: Callable[[np.ndarray], np.ndarray] = convergence_coefficient,
+                max_critical_points: int = MAX_CRITICAL_POINTS,
+                on_block: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Weighted integral, component energies and critical points in one grid pass
+
+        Integrals use the trapezoid rule on `resolution` uniform points over
+        [lower, upper], accumulated block by block. on_block, if given, is
+        called after every block with its ξ range, the critical points kept
+        from it (the ones that make it into critical_points), the running
+        critical point count, component energies and weighted integral.
+        """
+        if resolution < 2 or not upper > lower:
+            raise ValueError("analyze needs resolution >= 2 and upper > lower")
+        step = (upper - lower) / (resolution - 1)
+        energies = np.zeros(self.components)
+        weighted_integral = 0.0
+        critical_points = []
+        critical_count = 0
+        # Last two ψ samples of the previous block, so extrema on a block edge are found
+        tail_xi = np.empty(0)
+        tail_psi = np.empty(0)
+
+        grid = _LazyGrid(lower, step, resolution)
+        for window, components in self._blocks(grid):
+            xi = grid[window]
+            trapezoid = np.full(xi.size, step)
+            if window.start == 0:
+                trapezoid[0] *= 0.5
+            if window.stop == resolution:
+                trapezoid[-1] *= 0.5
+
+            psi = components.sum(axis=0)
+            np.square(components, out=components)
+            energies += components @ trapezoid
+            weighted_integral += float((weight(xi) * psi) @ trapezoid)
+
+            joined_xi = np.concatenate([tail_xi, xi])
+            joined_psi = np.concatenate([tail_psi, psi])
+            extrema = np.flatnonzero(np.diff(np.sign(np.diff(joined_psi)))) + 1
+            critical_count += extrema.size
+            room = max_critical_points - len(critical_points)
+            kept = joined_xi[extrema[:room]].tolist()
+            critical_points.extend(kept)
+            tail_xi, tail_psi = joined_xi[-2:], joined_psi[-2:]
+            if on_block is not None:
+                on_block({
+                    "xi_range": [float(xi[0]), float(xi[-1])],
+                    "critical_points": kept,
+                    "critical_point_count": critical_count,
+                    "component_energies": energies.tolist(),
+                    "weighted_integral": weighted_integral
+                })
+
+        critical = np.asarray(critical_points)
+        total_energy = energies.sum()
+        return {
+            "weighted_integral": weighted_integral,
+            "component_energies": energies.tolist(),
+            "energy_distribution": (energies / total_energy if total_energy else energies).tolist(),
+            "critical_points": critical.tolist(),
+            "weight_at_critical_points": weight(critical).tolist(),
+            "critical_point_count": critical_count,
+            "evaluations": self.components * resolution,
+            "block_size": min(self.block_size(), resolution)
+        }
+
+
+class _LazyGrid:
+    """Uniform grid lower + i·step that materializes only the slices asked for"""
+
+    def __init__(self, lower: float, step: float, size: int):
+        self.lower = lower
+        self.step = step
+        self.size = size
+
+    def __getitem__(self, window: slice) -> np.ndarray:
+        start, stop, _ = window.indices(self.size)
+        return self.lower + self.step * np.arange(start, stop, dtype=float)
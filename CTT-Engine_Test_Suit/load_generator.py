@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Asyncio load generator for /api/v1/solve reporting throughput and latency percentiles
+
+With --trace the report also breaks solve latency down by phase (see
+ctt_tracing.py), and --prometheus writes the phase histograms as Prometheus text.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+from ctt_async_client import AsyncCTTClient
+from ctt_problems import PROBLEMS, problem_names, solve_payload
+from ctt_tracing import TraceRecorder, print_breakdown
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+def latency_summary(latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    """Summarize a list of latencies (seconds) observed over an elapsed window"""
+    if not latencies:
+        return {"requests": 0, "throughput_rps": 0.0}
+    samples = np.asarray(latencies) * 1000.0
+    summary = {
+        "requests": len(latencies),
+        "throughput_rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": float(samples.mean()),
+        "max_ms": float(samples.max())
+    }
+    for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+        summary[f"p{q:g}_ms"] = float(value)
+    return summary
+
+
+class LoadGenerator:
+    """Keep a fixed number of solves in flight against the engine"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", concurrency: int = 16,
+                 duration: Optional[float] = 30.0, total_requests: Optional[int] = None,
+                 problems: Optional[List[str]] = None, trace: bool = False):
+        if duration is None and total_requests is None:
+            raise ValueError("Either duration or total_requests must be set")
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.duration = duration
+        self.total_requests = total_requests
+        self.problems = problems or problem_names()
+        for name in self.problems:
+            if name not in PROBLEMS:
+                raise ValueError(f"Unknown problem '{name}', choose from {problem_names()}")
+
+        # Per-phase histograms of every solve; responses are then also JSON-decoded
+        self.tracer = TraceRecorder() if trace else None
+        self.latencies: Dict[str, List[float]] = {name: [] for name in self.problems}
+        self.errors: Dict[str, int] = {name: 0 for name in self.problems}
+
+    async def _worker(self, client: AsyncCTTClient, schedule, deadline: Optional[float]):
+        for name in schedule:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            payload = solve_payload(name)
+            start = time.perf_counter()
+            try:
+                response = await client.solve(payload["problem_data"], payload["problem_type"],
+                                              timeout=PROBLEMS[name]["timeout"])
+                ok = response.status_code == 200
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                ok = False
+            elapsed = time.perf_counter() - start
+            if ok:
+                self.latencies[name].append(elapsed)
+                if self.tracer is not None:
+                    response.json()
+            else:
+                self.errors[name] += 1
+
+    async def run(self) -> Dict[str, Any]:
+        """Drive the load and return the report"""
+        # A shared iterator hands each worker the next problem in round-robin order,
+        # so the mix stays even and total_requests is honoured exactly.
+        schedule = itertools.cycle(self.problems)
+        if self.total_requests is not None:
+            schedule = itertools.islice(schedule, self.total_requests)
+
+        async with AsyncCTTClient(self.base_url, max_connections=self.concurrency,
+                                  tracer=self.tracer) as client:
+            start = time.perf_counter()
+            deadline = start + self.duration if self.duration is not None else None
+            await asyncio.gather(*[
+                self._worker(client, schedule, deadline) for _ in range(self.concurrency)
+            ])
+            elapsed = time.perf_counter() - start
+
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Build the per-problem and overall latency report"""
+        per_problem = {}
+        for name in self.problems:
+            summary = latency_summary(self.latencies[name], elapsed)
+            summary["problem_type"] = PROBLEMS[name]["problem_type"]
+            summary["errors"] = self.errors[name]
+            per_problem[name] = summary
+
+        overall = latency_summary(list(itertools.chain(*self.latencies.values())), elapsed)
+        overall["errors"] = sum(self.errors.values())
+        report = {
+            "base_url": self.base_url,
+            "concurrency": self.concurrency,
+            "elapsed": elapsed,
+            "overall": overall,
+            "problems": per_problem
+        }
+        if self.tracer is not None:
+            report["phases"] = self.tracer.to_dict()
+        return report
+
+
+def print_report(report: Dict[str, Any]):
+    """Pretty-print a load report"""
+    print("=" * 86)
+    print(f"CTT ENGINE LOAD TEST  {report['base_url']}  "
+          f"concurrency={report['concurrency']}  elapsed={report['elapsed']:.1f}s")
+    print("=" * 86)
+    print(f"{'problem':<24}{'req':>7}{'err':>5}{'req/s':>9}"
+          f"{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}  (ms)")
+    rows = list(report["problems"].items()) + [("ALL", report["overall"])]
+    for name, summary in rows:
+        if summary["requests"] == 0:
+            print(f"{name:<24}{0:>7}{summary['errors']:>5}{'-':>9}")
+            continue
+        print(f"{name:<24}{summary['requests']:>7}{summary['errors']:>5}"
+              f"{summary['throughput_rps']:>9.1f}{summary['p50_ms']:>9.2f}{summary['p90_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['p99.9_ms']:>9.2f}")
+    if "phases" in report:
+        print("-" * 86)
+        print_breakdown(report["phases"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load generator for the CTT engine")
+    parser.add_argument("--url", default="http://localhost:8000", help="Engine base URL")
+    parser.add_argument("--concurrency", type=int, default=16, help="Solves kept in flight")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many solves")
+    parser.add_argument("--problems", nargs="+", default=None,
+                        help=f"Problems to mix (default: all of {problem_names()})")
+    parser.add_argument("--output", default=None, help="Also write the report to this JSON file")
+    parser.add_argument("--trace", action="store_true", help="Break latency down by solve phase")
+    parser.add_argument("--prometheus", default=None,
+                        help="Write the phase histograms to this file as Prometheus text (implies --trace)")
+    args = parser.parse_args()
+
+    duration = args.duration
+    if duration is None and args.requests is None:
+        duration = 30.0
+
+    generator = LoadGenerator(args.url, args.concurrency, duration, args.requests, args.problems,
+                              trace=args.trace or args.prometheus is not None)
+    report = asyncio.run(generator.run())
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Load report saved to '{args.output}'")
+    if args.prometheus:
+        with open(args.prometheus, "w") as f:
+            f.write(generator.tracer.to_prometheus())
+        print(f"✓ Phase histograms saved to '{args.prometheus}'")
+
+
+if __name__ == "__main__":
+    main()
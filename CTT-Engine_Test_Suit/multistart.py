@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Vectorized multi-start optimizer for bounded one-dimensional ξ objectives
+
+Hundreds of starts, stratified over the bounds, advance together: every
+iteration evaluates the objective once for all active starts' finite
+differences and once for their trial points. Each start takes a Newton step
+where the objective is locally concave and a gradient step elsewhere, within
+its own trust radius. The radius grows after an improving step and shrinks
+after a rejected one, so multimodal objectives such as damped oscillations
+settle into their local optima without tuning a step size.
+
+Starts retire early once their steps fall below the tolerance, or once they
+reach another start's point with a worse value, so later iterations only pay
+for starts still searching.
+"""
+
+import time
+import numpy as np
+from typing import Callable, List, NamedTuple, Optional
+
+DEFAULT_STARTS = 256
+DEFAULT_MAX_ITERATIONS = 200
+DEFAULT_XTOL = 1e-10
+# Every iteration costs up to 3 objective evaluations per active start
+MAX_STARTS = 16384
+MAX_ITERATIONS = 10000
+# Local optima reported alongside the best one
+REPORTED_OPTIMA = 10
+
+
+class OptimizationResult(NamedTuple):
+    optimum: float
+    value: float
+    local_optima: List[List[float]]
+    evaluations: int
+    iterations: int
+    starts: int
+    converged_starts: int
+    wall_time: float
+
+    def as_dict(self):
+        return {
+            "optimal_xi": self.optimum,
+            "optimal_value": self.value,
+            "local_optima": self.local_optima,
+            "evaluations": self.evaluations,
+            "iterations": self.iterations,
+            "starts": self.starts,
+            "converged_starts": self.converged_starts,
+            "wall_time": self.wall_time
+        }
+
+
+def _initial_points(lower: float, upper: float, starts: int, rng: np.random.Generator) -> np.ndarray:
+    # One random point per equal-width stratum, plus both bounds
+    strata = (np.arange(starts - 2) + rng.random(starts - 2)) / max(starts - 2, 1)
+    return np.concatenate([[lower, upper], lower + strata * (upper - lower)])
+
+
+def maximize(f: Callable[[np.ndarray], np.ndarray], lower: float, upper: float,
+             starts: int = DEFAULT_STARTS, max_iterations: int = DEFAULT_MAX_ITERATIONS,
+             xtol: float = DEFAULT_XTOL, seed: int = 0,
+             on_iteration: Optional[Callable[[int, float, float, int], None]] = None) -> OptimizationResult:
+    """Maximize a vectorized f over [lower, upper] from `starts` starting points
+
+    f receives a 1-D array of ξ values and returns their objective values;
+    NaNs count as -inf. on_iteration, if given, is called after every
+    iteration with (iteration, best ξ, best value, active starts).
+    converged_starts counts every start retired before max_iterations, at
+    its own optimum or on reaching a better start's.
+    """
+    started = time.perf_counter()
+    if not lower < upper:
+        raise ValueError(f"Empty bounds [{lower}, {upper}]")
+    if not 1 <= starts <= MAX_STARTS:
+        raise ValueError(f"starts must be between 1 and {MAX_STARTS}, got {starts}")
+    if not 1 <= max_iterations <= MAX_ITERATIONS:
+        raise ValueError(f"max_iterations must be between 1 and {MAX_ITERATIONS}, got {max_iterations}")
+    starts = max(3, int(starts))
+
+    def evaluate(xi: np.ndarray) -> np.ndarray:
+        values = np.asarray(f(xi), dtype=float)
+        return np.where(np.isnan(values), -np.inf, np.broadcast_to(values, xi.shape))
+
+    x = _initial_points(lower, upper, starts, np.random.default_rng(seed))
+    fx = evaluate(x)
+    evaluations = x.size
+    radius = np.full(x.size, (upper - lower) / starts)
+    max_radius = (upper - lower) / 4
+    final_x, final_f = [], []
+    retired = 0
+
+    active = np.arange(x.size)
+    iterations = 0
+    while active.size and iterations < max_iterations:
+        iterations += 1
+        xa, fa, ra = x[active], fx[active], radius[active]
+
+        # Central differences for every active start in one call
+        h = 1e-5 * (1 + np.abs(xa))
+        around = evaluate(np.concatenate([xa - h, xa + h]))
+        evaluations += around.size
+        f_minus, f_plus = around[:xa.size], around[xa.size:]
+        # Infinite neighbours (NaN counts as -inf) make inf - inf; those starts fall back to gradient steps
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            gradient = (f_plus - f_minus) / (2 * h)
+            curvature = (f_plus - 2 * fa + f_minus) / h ** 2
+            newton = -gradient / curvature
+        step = np.where((curvature < 0) & np.isfinite(newton), newton, np.sign(gradient) * ra)
+        step = np.nan_to_num(np.clip(step, -ra, ra))
+
+        trial = np.clip(xa + step, lower, upper)
+        f_trial = evaluate(trial)
+        evaluations += trial.size
+        improved = f_trial >= fa
+        moved = np.abs(trial - xa)
+        x[active] = np.where(improved, trial, xa)
+        fx[active] = np.where(improved, f_trial, fa)
+        radius[active] = np.where(improved, np.minimum(2 * ra, max_radius), ra / 4)
+
+        # Retire converged starts, and starts that ran into a better one
+        tolerance = xtol * (1 + np.abs(x[active]))
+        converged = (improved & (moved <= tolerance)) | (radius[active] <= tolerance)
+        order = np.argsort(x[active])
+        xs, fs = x[active][order], fx[active][order]
+        duplicate = np.zeros(active.size, dtype=bool)
+        close = np.diff(xs) <= 1e3 * xtol * (1 + np.abs(xs[1:]))
+        duplicate[order[1:][close & (fs[1:] <= fs[:-1])]] = True
+        duplicate[order[:-1][close & (fs[:-1] < fs[1:])]] = True
+
+        final_x.extend(x[active][converged & ~duplicate])
+        final_f.extend(fx[active][converged & ~duplicate])
+        retired += int(np.count_nonzero(converged | duplicate))
+        active = active[~(converged | duplicate)]
+        if on_iteration is not None:
+            best = int(np.argmax(fx))
+            on_iteration(iterations, float(x[best]), float(fx[best]), int(active.size))
+
+    final_x.extend(x[active])
+    final_f.extend(fx[active])
+    best = int(np.argmax(fx))
+
+    # Distinct local optima, best first
+    optima = []
+    for index in np.argsort(final_f)[::-1]:
+        point = float(final_x[index])
+        if np.isfinite(final_f[index]) and all(abs(point - p) > 1e3 * xtol * (1 + abs(p)) for p, _ in optima):
+            optima.append([point, float(final_f[index])])
+        if len(optima) == REPORTED_OPTIMA:
+            break
+    return OptimizationResult(float(x[best]), float(fx[best]), optima, evaluations, iterations,
+                              starts, retired, time.perf_counter() - started)
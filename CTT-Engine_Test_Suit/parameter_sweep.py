@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Parallel parameter sweeps over Cartesian grids such as wave_convergence's
+frequency_components × damping_factors
+
+A sweep is split into contiguous work units of grid points. Units run either
+in a process pool (each unit evaluated as one vectorized call) or as
+concurrent batch solves against the engine. Results stream back into one
+array labelled by the sweep axes as units complete.
+"""
+
+import asyncio
+import functools
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional, Sequence, Tuple
+
+from ctt_async_client import AsyncCTTClient
+
+DEFAULT_UNIT_SIZE = 256
+# Integrand values held at once by damped_wave_integrals (float64 elements per temporary)
+XI_BLOCK_ELEMENTS = 1 << 20
+
+# Vectorized point function: {axis: 1-D values for the unit's points} -> 1-D results
+PointFunction = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+
+class SweepResult:
+    """Sweep values as an N-D array with named, labelled axes"""
+
+    def __init__(self, axes: Dict[str, np.ndarray], values: np.ndarray):
+        self.axes = axes
+        self.values = values
+
+    def sel(self, **coordinates) -> Any:
+        """Select by axis label, e.g. result.sel(frequency_components=4.0)"""
+        index = []
+        for name, labels in self.axes.items():
+            if name in coordinates:
+                matches = np.flatnonzero(labels == coordinates[name])
+                if matches.size == 0:
+                    raise KeyError(f"{coordinates[name]!r} is not a label of axis '{name}'")
+                index.append(int(matches[0]))
+            else:
+                index.append(slice(None))
+        return self.values[tuple(index)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "axes": {name: labels.tolist() for name, labels in self.axes.items()},
+            "values": self.values.tolist()
+        }
+
+
+class ParameterSweep:
+    """Cartesian product of named parameter axes"""
+
+    def __init__(self, axes: Dict[str, Sequence[float]]):
+        if not axes:
+            raise ValueError("A sweep needs at least one axis")
+        self.axes = {name: np.asarray(values) for name, values in axes.items()}
+        self.shape = tuple(labels.size for labels in self.axes.values())
+        self.size = int(np.prod(self.shape))
+
+    def points(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Parameter values of flat grid points [start, stop), one array per axis"""
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: labels[index] for (name, labels), index in zip(self.axes.items(), indices)}
+
+    def work_units(self, unit_size: int = DEFAULT_UNIT_SIZE) -> Iterator[Tuple[int, int]]:
+        for start in range(0, self.size, unit_size):
+            yield start, min(start + unit_size, self.size)
+
+    def run(self, function: PointFunction, processes: Optional[int] = None,
+            unit_size: int = DEFAULT_UNIT_SIZE, dtype=float,
+            progress: Optional[Callable[[float], None]] = None,
+            on_unit: Optional[Callable[[int, int, np.ndarray], None]] = None) -> SweepResult:
+        """Evaluate a picklable vectorized point function over the whole grid
+
+        processes=None uses every core, processes=0 runs the units in this process.
+        progress, if given, is called with the completed fraction after every unit,
+        and on_unit with (start, stop, values) of each unit's flat grid points.
+        """
+        values = np.empty(self.size, dtype=dtype)
+        done = 0
+        if processes == 0:
+            for start, stop in self.work_units(unit_size):
+                values[start:stop] = function(self.points(start, stop))
+                done += stop - start
+                if on_unit is not None:
+                    on_unit(start, stop, values[start:stop])
+                if progress is not None:
+                    progress(done / self.size)
+        else:
+            with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as pool:
+                futures = {
+                    pool.submit(_run_unit, function, self.points(start, stop)): (start, stop)
+                    for start, stop in self.work_units(unit_size)
+                }
+                for future in as_completed(futures):
+                    start, stop = futures[future]
+                    values[start:stop] = future.result()
+                    done += stop - start
+                    if on_unit is not None:
+                        on_unit(start, stop, values[start:stop])
+                    if progress is not None:
+                        progress(done / self.size)
+        return SweepResult(self.axes, values.reshape(self.shape))
+
+    def run_remote(self, build_problem: Callable[[Dict[str, float]], Tuple[Any, str]],
+                   extract: Callable[[Any], float], base_url: str = "http://localhost:8000",
+                   concurrency: int = 8, unit_size: int = DEFAULT_UNIT_SIZE,
+                   timeout: float = 60) -> SweepResult:
+        """Solve every grid point on the engine, one batch request per work unit
+
+        build_problem maps a point {axis: value} to (problem_data, problem_type);
+        extract maps a per-item solution to the number stored in the result.
+        Points whose solve fails are stored as NaN.
+        """
+        return asyncio.run(self._run_remote(build_problem, extract, base_url,
+                                            concurrency, unit_size, timeout))
+
+    async def _run_remote(self, build_problem, extract, base_url, concurrency, unit_size, timeout):
+        values = np.full(self.size, np.nan)
+        units = iter(self.work_units(unit_size))
+
+        async def worker(client: AsyncCTTClient):
+            for start, stop in units:
+                points = self.points(start, stop)
+                batch = []
+                for i in range(stop - start):
+                    point = {name: labels[i].item() for name, labels in points.items()}
+                    problem_data, problem_type = build_problem(point)
+                    batch.append({"problem_data": problem_data, "problem_type": problem_type})
+                response = await client.solve_batch(batch, timeout=timeout)
+                if response.status_code != 200:
+                    raise RuntimeError(f"Batch solve failed: {response.status_code} - {response.text}")
+                for offset, item in enumerate(response.json()["results"]):
+                    if item.get("status") == "success":
+                        values[start + offset] = extract(item["solution"])
+
+        async with AsyncCTTClient(base_url, max_connections=concurrency) as client:
+            await asyncio.gather(*[worker(client) for _ in range(concurrency)])
+        return SweepResult(self.axes, values.reshape(self.shape))
+
+
+def _run_unit(function: PointFunction, points: Dict[str, np.ndarray]) -> np.ndarray:
+    return np.asarray(function(points))
+
+
+def damped_wave_integrals(points: Dict[str, np.ndarray], integration_range: List[float],
+                          xi_points: int) -> np.ndarray:
+    """∫ sin(2π f ξ) exp(-d ξ²) dξ for every (frequency_components, damping_factors) point
+
+    The ξ grid is integrated in blocks that share their end points, so
+    temporaries stay near XI_BLOCK_ELEMENTS values whatever ξ_points is.
+    """
+    xi = np.linspace(float(integration_range[0]), float(integration_range[1]), int(xi_points))
+    frequencies = np.asarray(points["frequency_components"], dtype=float)[:, None]
+    damping = np.asarray(points["damping_factors"], dtype=float)[:, None]
+    total = np.zeros(frequencies.shape[0])
+    block = max(2, XI_BLOCK_ELEMENTS // max(1, frequencies.shape[0]))
+    for start in range(0, xi.size - 1, block - 1):
+        segment = xi[start:start + block]
+        waves = np.sin(2 * np.pi * frequencies * segment) * np.exp(-damping * np.square(segment))
+        total += np.trapezoid(waves, segment, axis=-1)
+    return total
+
+
+def wave_convergence_sweep(problem: Dict[str, Any]) -> Tuple[ParameterSweep, PointFunction]:
+    """Sweep and point function for a wave_convergence problem's convergence_analysis"""
+    analysis = problem["convergence_analysis"]
+    sweep = ParameterSweep({
+        "frequency_components": analysis["frequency_components"],
+        "damping_factors": analysis["damping_factors"]
+    })
+    function = functools.partial(damped_wave_integrals,
+                                 integration_range=problem.get("integration_range", [0, 5]),
+                                 xi_points=analysis.get("ξ_points", 1000))
+    return sweep, function
+
+
+def wave_point_problem(integration_range: List[float]) -> Callable[[Dict[str, float]], Tuple[Any, str]]:
+    """build_problem for run_remote: one damped-wave integral per sweep point"""
+    def build(point: Dict[str, float]) -> Tuple[Any, str]:
+        expression = (f"sin(2*π*{point['frequency_components']!r}*ξ) "
+                      f"* exp(-{point['damping_factors']!r}*ξ^2)")
+        return {"expression": expression, "range": list(integration_range)}, "mathematical"
+    return build
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from ctt_problems import WAVE_CONVERGENCE_PROBLEM
+
+    parser = argparse.ArgumentParser(description="Parallel wave_convergence parameter sweep")
+    parser.add_argument("--frequencies", type=int, default=100, help="Frequency axis length")
+    parser.add_argument("--dampings", type=int, default=100, help="Damping axis length")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (0 = serial)")
+    parser.add_argument("--remote", default=None, help="Solve the points on this engine URL instead")
+    args = parser.parse_args()
+
+    problem = dict(WAVE_CONVERGENCE_PROBLEM)
+    problem["convergence_analysis"] = dict(problem["convergence_analysis"],
+                                           frequency_components=np.linspace(1, 8, args.frequencies),
+                                           damping_factors=np.linspace(0.1, 1.0, args.dampings))
+    sweep, function = wave_convergence_sweep(problem)
+
+    start = time.perf_counter()
+    if args.remote:
+        result = sweep.run_remote(wave_point_problem(problem["integration_range"]),
+                                  lambda solution: solution["integral"], args.remote)
+    else:
+        result = sweep.run(function, processes=args.processes)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Swept {sweep.size} points {sweep.shape} in {elapsed:.2f}s "
+          f"({sweep.size / elapsed:.0f} points/s)")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Performance regression suite for /api/v1/solve with stored baselines
+
+Every catalog problem (ctt_problems.PROBLEMS) is solved after a few warmup
+runs, many times over, in interleaved rounds so slow drift on the machine
+hits every problem alike. By default the engine cache is cleared before each
+sample so the samples time real solves rather than cache hits.
+
+    python perf_regression.py record --name main       # store a baseline
+    python perf_regression.py compare --baseline main  # exit 1 on regression
+
+A comparison bootstraps a confidence interval for the ratio of the current
+p50 and p99 to the baseline's, and runs a one-sided Mann-Whitney U test for
+a shift of the whole distribution. A quantile has regressed when its ratio
+exceeds 1 + threshold and the interval lies entirely above 1.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+import numpy as np
+import requests
+from typing import Dict, List, Any, Optional
+
+from ctt_problems import PROBLEMS, problem_names, solve_payload
+
+DEFAULT_BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baselines")
+DEFAULT_SAMPLES = 50
+DEFAULT_WARMUP = 5
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+# Fractional slowdown tolerated before a quantile counts as regressed
+DEFAULT_THRESHOLDS = {"p50": 0.10, "p99": 0.20}
+QUANTILES = {"p50": 50, "p99": 99}
+
+
+def environment_metadata(base_url: str, session: requests.Session) -> Dict[str, Any]:
+    """Where and against what a benchmark ran, stored alongside its samples"""
+    metadata = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "base_url": base_url
+    }
+    try:
+        metadata["engine"] = session.get(f"{base_url}/api/v1/health", timeout=5).json().get("version")
+    except (requests.RequestException, ValueError):
+        metadata["engine"] = None
+    try:
+        metadata["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        metadata["git_commit"] = None
+    return metadata
+
+
+class RegressionBenchmark:
+    """Collect latency samples for catalog problems against one engine"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", samples: int = DEFAULT_SAMPLES,
+                 warmup: int = DEFAULT_WARMUP, problems: Optional[List[str]] = None,
+                 cold: bool = True):
+        self.base_url = base_url.rstrip('/')
+        self.samples = samples
+        self.warmup = warmup
+        self.cold = cold
+        self.problems = problems or problem_names()
+        for name in self.problems:
+            if name not in PROBLEMS:
+                raise ValueError(f"Unknown problem '{name}', choose from {problem_names()}")
+        self.session = requests.Session()
+
+    def _sample(self, name: str) -> Dict[str, float]:
+        if self.cold:
+            self.session.post(f"{self.base_url}/api/v1/clear", timeout=10)
+        payload = solve_payload(name)
+        start = time.perf_counter()
+        response = self.session.post(f"{self.base_url}/api/v1/solve", json=payload,
+                                     timeout=PROBLEMS[name]["timeout"])
+        latency = time.perf_counter() - start
+        if response.status_code != 200:
+            raise RuntimeError(f"{name}: solve failed ({response.status_code}): {response.text[:200]}")
+        result = response.json()
+        if result.get("status") != "success":
+            raise RuntimeError(f"{name}: solve failed: {result.get('error')}")
+        return {"latency": latency, "engine": float(result.get("computation_time", 0.0))}
+
+    def run(self) -> Dict[str, Any]:
+        """Warm up, then take samples in interleaved rounds over every problem"""
+        for _ in range(self.warmup):
+            for name in self.problems:
+                self._sample(name)
+        latencies = {name: [] for name in self.problems}
+        engine_times = {name: [] for name in self.problems}
+        for _ in range(self.samples):
+            for name in self.problems:
+                sample = self._sample(name)
+                latencies[name].append(sample["latency"])
+                engine_times[name].append(sample["engine"])
+        return {
+            "metadata": {**environment_metadata(self.base_url, self.session),
+                         "samples": self.samples, "warmup": self.warmup, "cold": self.cold},
+            "problems": {
+                name: {
+                    "problem_type": PROBLEMS[name]["problem_type"],
+                    "latency": latencies[name],
+                    "engine_time": engine_times[name]
+                }
+                for name in self.problems
+            }
+        }
+
+
+def baseline_path(name: str, directory: str = DEFAULT_BASELINE_DIR) -> str:
+    return os.path.join(directory, f"{name}.json")
+
+
+def save_baseline(run: Dict[str, Any], name: str, directory: str = DEFAULT_BASELINE_DIR) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = baseline_path(name, directory)
+    with open(path, "w") as f:
+        json.dump(run, f, indent=2)
+    return path
+
+
+def load_baseline(name: str, directory: str = DEFAULT_BASELINE_DIR) -> Dict[str, Any]:
+    path = name if name.endswith(".json") else baseline_path(name, directory)
+    with open(path) as f:
+        return json.load(f)
+
+
+def bootstrap_ratio(baseline: np.ndarray, current: np.ndarray, q: float,
+                    resamples: int = BOOTSTRAP_RESAMPLES, confidence: float = CONFIDENCE,
+                    seed: int = 0) -> Dict[str, float]:
+    """Percentile-bootstrap interval for quantile(current, q) / quantile(baseline, q)"""
+    rng = np.random.default_rng(seed)
+    base = np.percentile(baseline[rng.integers(0, baseline.size, (resamples, baseline.size))], q, axis=1)
+    cur = np.percentile(current[rng.integers(0, current.size, (resamples, current.size))], q, axis=1)
+    ratios = cur / base
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(ratios, [tail, 100 - tail])
+    return {
+        "baseline_ms": float(np.percentile(baseline, q)) * 1000,
+        "current_ms": float(np.percentile(current, q)) * 1000,
+        "ratio": float(np.percentile(current, q) / np.percentile(baseline, q)),
+        "ci_low": float(low),
+        "ci_high": float(high)
+    }
+
+
+def mann_whitney_greater(baseline: np.ndarray, current: np.ndarray) -> Dict[str, float]:
+    """One-sided Mann-Whitney U test that current tends to be slower than baseline
+
+    Normal approximation with tie correction, fine at the sample sizes the
+    suite takes.
+    """
+    n1, n2 = current.size, baseline.size
+    combined = np.concatenate([current, baseline])
+    order = np.argsort(combined, kind="mergesort")
+    ranks = np.empty(combined.size)
+    ranks[order] = np.arange(1, combined.size + 1)
+    values, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    # Tied values share their mean rank
+    ranks = (np.bincount(inverse, weights=ranks) / counts)[inverse]
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - np.sum(counts ** 3 - counts) / (n * (n - 1)))
+    if variance <= 0:
+        return {"u": float(u), "p_value": 1.0}
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return {"u": float(u), "p_value": 0.5 * math.erfc(z / math.sqrt(2))}
+
+
+def compare_runs(baseline: Dict[str, Any], current: Dict[str, Any],
+                 thresholds: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Per-problem quantile ratios with confidence intervals and regression verdicts"""
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    problems = {}
+    for name, run in current["problems"].items():
+        if name not in baseline["problems"]:
+            continue
+        base = np.asarray(baseline["problems"][name]["latency"])
+        cur = np.asarray(run["latency"])
+        comparison = {"mann_whitney": mann_whitney_greater(base, cur), "regressions": []}
+        for label, q in QUANTILES.items():
+            stat = bootstrap_ratio(base, cur, q)
+            stat["threshold"] = thresholds[label]
+            stat["regressed"] = stat["ratio"] > 1 + thresholds[label] and stat["ci_low"] > 1.0
+            comparison[label] = stat
+            if stat["regressed"]:
+                comparison["regressions"].append(label)
+        problems[name] = comparison
+    return {
+        "baseline": baseline["metadata"],
+        "current": current["metadata"],
+        "thresholds": thresholds,
+        "problems": problems,
+        "regressed": sorted(name for name, c in problems.items() if c["regressions"]),
+        "missing": sorted(set(current["problems"]) - set(baseline["problems"]))
+    }
+
+
+def print_comparison(report: Dict[str, Any]):
+    """Pretty-print a comparison, flagging every regressed quantile"""
+    base, cur = report["baseline"], report["current"]
+    print("=" * 96)
+    print(f"CTT PERFORMANCE REGRESSION CHECK  baseline {base['timestamp']} ({base.get('engine')})"
+          f"  vs  current {cur['timestamp']} ({cur.get('engine')})")
+    print("=" * 96)
+    print(f"{'problem':<24}{'stat':<6}{'baseline':>10}{'current':>10}{'ratio':>8}"
+          f"{'95% CI':>18}{'MW p':>9}  verdict")
+    for name, c in report["problems"].items():
+        for label in QUANTILES:
+            s = c[label]
+            verdict = f"REGRESSED (> +{s['threshold']:.0%})" if s["regressed"] else "ok"
+            interval = f"[{s['ci_low']:.2f}, {s['ci_high']:.2f}]"
+            p_value = f"{c['mann_whitney']['p_value']:.3f}" if label == "p50" else ""
+            print(f"{name if label == 'p50' else '':<24}{label:<6}{s['baseline_ms']:>10.2f}"
+                  f"{s['current_ms']:>10.2f}{s['ratio']:>8.2f}{interval:>18}{p_value:>9}  {verdict}")
+    if report["missing"]:
+        print(f"No baseline for: {', '.join(report['missing'])}")
+    print("-" * 96)
+    if report["regressed"]:
+        print(f"✗ Regression in {len(report['regressed'])} problem(s): {', '.join(report['regressed'])}")
+    else:
+        print("✓ No regression beyond thresholds")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CTT engine against a stored baseline")
+    parser.add_argument("command", choices=["record", "compare"])
+    parser.add_argument("--url", default="http://localhost:8000", help="Engine base URL")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Samples per problem")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Warmup rounds")
+    parser.add_argument("--problems", nargs="+", default=None,
+                        help=f"Problems to benchmark (default: all of {problem_names()})")
+    parser.add_argument("--warm", action="store_true",
+                        help="Keep the engine cache between samples (times cache hits)")
+    parser.add_argument("--name", default="baseline", help="Baseline name to record")
+    parser.add_argument("--baseline", default="baseline", help="Baseline name or JSON file to compare against")
+    parser.add_argument("--baseline-dir", default=DEFAULT_BASELINE_DIR, help="Where baselines are kept")
+    parser.add_argument("--p50-threshold", type=float, default=DEFAULT_THRESHOLDS["p50"])
+    parser.add_argument("--p99-threshold", type=float, default=DEFAULT_THRESHOLDS["p99"])
+    parser.add_argument("--output", default=None, help="Also write the comparison to this JSON file")
+    args = parser.parse_args()
+
+    benchmark = RegressionBenchmark(args.url, args.samples, args.warmup, args.problems, cold=not args.warm)
+    run = benchmark.run()
+    if args.command == "record":
+        path = save_baseline(run, args.name, args.baseline_dir)
+        print(f"✓ Baseline '{args.name}' with {args.samples} samples per problem saved to '{path}'")
+        return
+
+    report = compare_runs(load_baseline(args.baseline, args.baseline_dir), run,
+                          {"p50": args.p50_threshold, "p99": args.p99_threshold})
+    print_comparison(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Comparison saved to '{args.output}'")
+    sys.exit(1 if report["regressed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
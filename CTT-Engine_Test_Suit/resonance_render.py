@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Headless rendering of resonance readings, downsampled before plotting
+
+Long series are reduced to a few thousand points first, either by LTTB
+(largest-triangle-three-buckets, which keeps the visual shape of the line) or
+by min/max decimation (which keeps every peak and trough of each bucket).
+Figures are drawn on matplotlib's Agg canvas without pyplot, so nothing
+opens a window. matplotlib is imported only when a figure is drawn, keeping
+it out of the import path of code that never plots. Many channels render in
+parallel worker processes, one figure per channel:
+
+    python resonance_render.py captures.npz --output-dir figures --workers 8
+"""
+
+import argparse
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+DEFAULT_MAX_POINTS = 4000
+# Series at most this long keep their markers
+MARKER_POINTS = 50
+METHODS = ["lttb", "minmax"]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Indices of the `points` samples LTTB keeps, first and last included"""
+    n = x.size
+    if points >= n or points < 3:
+        return np.arange(n)
+    # Bucket i covers [edges[i], edges[i + 1]) and the final point is a bucket of
+    # its own, so every bucket's average comes from one reduceat
+    edges = (np.arange(points - 1) * (n - 2) / (points - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    counts = np.diff(np.append(edges, n))
+    mean_x = np.add.reduceat(x, edges) / counts
+    mean_y = np.add.reduceat(y, edges) / counts
+
+    kept = np.empty(points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area between the previous pick, each candidate and the next bucket's mean
+        area = np.abs((x[a] - mean_x[i + 1]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (mean_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax(y: np.ndarray, points: int) -> np.ndarray:
+    """Indices of each bucket's minimum and maximum, in order, for about `points` samples"""
+    n = y.size
+    buckets = points // 2
+    if points >= n or buckets < 1:
+        return np.arange(n)
+    size = -(-n // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(buckets, size)
+    valid = ~np.all(np.isnan(blocks), axis=1)
+    offsets = np.arange(buckets)[valid] * size
+    lows = offsets + np.nanargmin(blocks[valid], axis=1)
+    highs = offsets + np.nanargmax(blocks[valid], axis=1)
+    return np.unique(np.concatenate([[0, n - 1], lows, highs]))
+
+
+def downsample(x: Sequence[float], y: Sequence[float], max_points: int = DEFAULT_MAX_POINTS,
+               method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """(x, y) reduced to at most about max_points samples by LTTB or min/max decimation"""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if method not in METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}', choose from {METHODS}")
+    kept = lttb(x, y, max_points) if method == "lttb" else minmax(y, max_points)
+    return x[kept], y[kept]
+
+
+def _figure(figsize: Tuple[float, float]):
+    # Lazy import: the Agg canvas needs no display and no pyplot state
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _plot(axes, x: np.ndarray, y: np.ndarray, label: Optional[str] = None):
+    style = {"linewidth": 2, "marker": "o", "markersize": 6} if x.size <= MARKER_POINTS else {"linewidth": 0.8}
+    axes.plot(x, y, label=label, **style)
+
+
+def render_channel(job: Dict[str, Any]) -> str:
+    """Downsample and draw one channel's series to job["path"]; runs in a worker process"""
+    x, y = downsample(job["x"], job["y"], job["max_points"], job["method"])
+    figure = _figure((10, 4))
+    axes = figure.add_subplot()
+    _plot(axes, x, y)
+    axes.set_title(f"{job['title']} ({np.asarray(job['y']).size} samples, {x.size} plotted)")
+    axes.set_xlabel(job.get("xlabel", "Time"))
+    axes.set_ylabel("Amplitude")
+    axes.grid(True, alpha=0.3)
+    figure.tight_layout()
+    figure.savefig(job["path"], dpi=job.get("dpi", 150))
+    return job["path"]
+
+
+def render_channels(readings: np.ndarray, times: Optional[np.ndarray] = None, output_dir: str = ".",
+                    max_points: int = DEFAULT_MAX_POINTS, method: str = "lttb",
+                    workers: Optional[int] = None, prefix: str = "channel") -> List[str]:
+    """Render one figure per channel of readings (samples × channels) in parallel processes"""
+    readings = np.asarray(readings, dtype=float)
+    if readings.ndim == 1:
+        readings = readings[:, None]
+    times = np.arange(readings.shape[0], dtype=float) if times is None else np.asarray(times, dtype=float)
+    if times.size != readings.shape[0]:
+        raise ValueError("times needs one entry per row of readings")
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [
+        {"x": times, "y": np.ascontiguousarray(readings[:, channel]), "max_points": max_points,
+         "method": method, "title": f"Resonance channel {channel}",
+         "path": os.path.join(output_dir, f"{prefix}_{channel:03d}.png")}
+        for channel in range(readings.shape[1])
+    ]
+    if workers == 1 or len(jobs) == 1:
+        return [render_channel(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_channel, jobs))
+
+
+def render_resonance_patterns(readings: Sequence[Sequence[float]], time_intervals: Sequence[float],
+                              path: str = "resonance_patterns.png", max_points: int = DEFAULT_MAX_POINTS,
+                              method: str = "lttb") -> str:
+    """One line per time interval across the resonance channels, as in the test suite's overview"""
+    figure = _figure((10, 6))
+    axes = figure.add_subplot()
+    for t, row in zip(time_intervals, readings):
+        row = np.asarray(row, dtype=float)
+        x, y = downsample(np.arange(row.size), row, max_points, method)
+        _plot(axes, x, y, label=f"t={t}")
+    axes.set_title("Temporal Resonance Patterns", fontsize=14, fontweight='bold')
+    axes.set_xlabel("Resonance Channel", fontsize=12)
+    axes.set_ylabel("Amplitude", fontsize=12)
+    axes.legend()
+    axes.grid(True, alpha=0.3)
+    figure.tight_layout()
+    figure.savefig(path, dpi=150, bbox_inches='tight')
+    return path
+
+
+def load_readings(path: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """(readings, times) from a .npy array or an .npz with "readings" and optional "times" """
+    if path.endswith(".npz"):
+        with np.load(path) as archive:
+            return archive["readings"], archive["times"] if "times" in archive else None
+    return np.load(path, mmap_mode="r"), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render resonance channels headlessly, downsampled")
+    parser.add_argument("readings", help=".npy (samples × channels) or .npz with readings and times")
+    parser.add_argument("--output-dir", default="resonance_figures", help="Where figures are written")
+    parser.add_argument("--max-points", type=int, default=DEFAULT_MAX_POINTS, help="Points plotted per channel")
+    parser.add_argument("--method", choices=METHODS, default="lttb", help="Downsampling algorithm")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    args = parser.parse_args()
+
+    readings, times = load_readings(args.readings)
+    paths = render_channels(readings, times, args.output_dir, args.max_points, args.method, args.workers)
+    print(f"✓ Rendered {len(paths)} channel figures to '{args.output_dir}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Persistent, content-addressed cache of engine solve results
+
+Results are stored in SQLite under the problem_hash of their request, so an
+unchanged problem is answered from disk on every later run without touching
+the engine. Entries are evicted least-recently-used first whenever the cache
+exceeds its entry or byte budget, and may carry a time-to-live.
+
+    python result_cache.py stats
+    python result_cache.py clear
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+
+from ctt_problems import problem_hash
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "CTT_RESULT_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "ctt", "results.sqlite"))
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    problem_hash TEXT PRIMARY KEY,
+    problem_type TEXT NOT NULL,
+    response     TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    created_at   REAL NOT NULL,
+    accessed_at  REAL NOT NULL,
+    expires_at   REAL
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+
+class ResultCache:
+    """On-disk LRU cache of successful solve responses, keyed on problem_hash
+
+    ttl (seconds) applies to entries stored without one of their own; None
+    keeps entries until they are evicted.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, problem_data: Any, problem_type: str) -> Optional[Dict[str, Any]]:
+        """Cached response for a problem, or None on a miss or an expired entry"""
+        key = problem_hash(problem_data, problem_type)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, expires_at FROM results WHERE problem_hash = ?", (key,)).fetchone()
+            if row is not None and row[1] is not None and row[1] <= now:
+                self._db.execute("DELETE FROM results WHERE problem_hash = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE results SET accessed_at = ? WHERE problem_hash = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, problem_data: Any, problem_type: str, response: Dict[str, Any],
+            ttl: Optional[float] = None):
+        """Store a successful response; anything else is left uncached"""
+        if response.get("status") not in (None, "success"):
+            return
+        key = problem_hash(problem_data, problem_type)
+        text = json.dumps(response, separators=(",", ":"), ensure_ascii=False)
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, problem_type, text, len(text.encode("utf-8")), now, now,
+                 now + ttl if ttl is not None else None))
+            self._evict(now)
+
+    def solve(self, problem_data: Any, problem_type: str,
+              fetch: Callable[[Any, str], Dict[str, Any]]) -> Dict[str, Any]:
+        """Cached response if there is one, otherwise fetch(problem_data, problem_type) and store it"""
+        response = self.get(problem_data, problem_type)
+        if response is None:
+            response = fetch(problem_data, problem_type)
+            self.put(problem_data, problem_type, response)
+        return response
+
+    def _evict(self, now: float):
+        # Expired entries go first, then the least recently used until both budgets hold
+        evicted = self._db.execute(
+            "DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)).rowcount
+        entries, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if entries > self.max_entries or size > self.max_bytes:
+            cursor = self._db.execute(
+                "SELECT problem_hash, size FROM results ORDER BY accessed_at ASC")
+            victims = []
+            for key, entry_size in cursor:
+                if entries <= self.max_entries and size <= self.max_bytes:
+                    break
+                victims.append((key,))
+                entries -= 1
+                size -= entry_size
+            self._db.executemany("DELETE FROM results WHERE problem_hash = ?", victims)
+            evicted += len(victims)
+        self.evictions += evicted
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the client result cache")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--path", default=DEFAULT_CACHE_PATH, help="SQLite cache file")
+    args = parser.parse_args()
+
+    with ResultCache(args.path) as cache:
+        if args.command == "clear":
+            cache.clear()
+            print(f"✓ Cleared {args.path}")
+        else:
+            stats = cache.stats()
+            print(f"✓ {stats['entries']} entries, {stats['bytes'] / 1024:.1f} KiB in {stats['path']}")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Soak test: replay a weighted mix of the suite's problems for hours and watch for drift
+
+A fixed number of solves is kept in flight against the engine. Problems are
+drawn from the catalog (ctt_problems.PROBLEMS) by weight, and every window
+records its latency percentiles. Payloads are sent unchanged by default, so
+after the first pass a caching engine answers most of them from its result
+cache. --cold-pool N adds a soak_nonce field to problem_data, cycling through
+N values per problem: each nonce is a new problem_hash the engine must really
+solve. With N above the engine's cache capacity every request misses, and the
+soak adds at most N entries per problem to an unbounded cache. Filling the
+cache raises RSS for the first pass through the pool, so a short cold soak can
+be flagged for memory growth that is only the cache; run long enough for
+that plateau to dominate the trend. When the engine runs on this machine the
+server process's RSS and CPU are sampled from /proc as well; its pid comes
+from --pid or from the socket listening on the target port.
+
+At the end the per-window series are checked with a Mann-Kendall trend test.
+Memory has grown when RSS trends up significantly by more than a set amount.
+Latency has drifted when p50 or p99 trends up significantly and the last
+quarter of the run is slower than the first by more than a set fraction.
+
+    python soak_test.py --duration 14400 --window 60 --mix temporal_decay=1 mathematical=5
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
+
+from ctt_async_client import AsyncCTTClient
+from ctt_problems import PROBLEMS, problem_names, solve_payload
+from load_generator import latency_summary
+
+# Trend significance, and the growth that must come with it before a series is flagged
+TREND_ALPHA = 0.01
+MIN_RSS_GROWTH_BYTES = 16 * 1024 ** 2
+MAX_LATENCY_DRIFT = 0.10
+MIN_WINDOWS = 8
+
+
+def find_listening_pid(port: int) -> Optional[int]:
+    """pid of the local process listening on a TCP port, from /proc, or None"""
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    # st 0A is LISTEN
+                    if int(fields[1].rsplit(":", 1)[1], 16) == port and fields[3] == "0A":
+                        inodes.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            for fd in os.listdir(f"/proc/{pid}/fd"):
+                if os.readlink(f"/proc/{pid}/fd/{fd}") in inodes:
+                    return int(pid)
+        except OSError:
+            continue
+    return None
+
+
+class ProcessSampler:
+    """RSS and CPU usage of one process, read from /proc"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._last_cpu = self.cpu_seconds()
+        self._last_time = time.perf_counter()
+
+    def rss_bytes(self) -> int:
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def cpu_seconds(self) -> float:
+        with open(f"/proc/{self.pid}/stat") as f:
+            # The command name may hold spaces; fields after it start at state
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self._clock_ticks
+
+    def sample(self) -> Dict[str, float]:
+        """RSS now and CPU use (in cores) since the previous sample"""
+        cpu, now = self.cpu_seconds(), time.perf_counter()
+        sample = {"rss_bytes": self.rss_bytes(),
+                  "cpu_cores": (cpu - self._last_cpu) / (now - self._last_time)}
+        self._last_cpu, self._last_time = cpu, now
+        return sample
+
+
+def mann_kendall(series: List[float]) -> Dict[str, float]:
+    """Mann-Kendall test for a monotonic upward trend, with the Theil-Sen slope per step"""
+    values = np.asarray(series, dtype=float)
+    n = values.size
+    i, j = np.triu_indices(n, k=1)
+    differences = values[j] - values[i]
+    s = float(np.sign(differences).sum())
+    _, counts = np.unique(values, return_counts=True)
+    variance = (n * (n - 1) * (2 * n + 5) - np.sum(counts * (counts - 1) * (2 * counts + 5))) / 18
+    z = (s - np.sign(s)) / math.sqrt(variance) if variance > 0 else 0.0
+    return {
+        "s": s,
+        "z": float(z),
+        "p_value": 0.5 * math.erfc(z / math.sqrt(2)),
+        "slope": float(np.median(differences / (j - i))) if n > 1 else 0.0
+    }
+
+
+def detect_drift(windows: List[Dict[str, Any]], window_seconds: float,
+                 min_rss_growth: int = MIN_RSS_GROWTH_BYTES,
+                 max_latency_drift: float = MAX_LATENCY_DRIFT) -> Dict[str, Any]:
+    """Memory growth and latency drift verdicts over the recorded windows"""
+    findings: Dict[str, Any] = {}
+    measured = [w for w in windows if w["requests"]]
+    if len(measured) < MIN_WINDOWS:
+        return {"flagged": [], "note": f"Fewer than {MIN_WINDOWS} windows, no trend analysis"}
+
+    per_hour = 3600 / window_seconds
+    rss = [w["rss_bytes"] for w in measured if "rss_bytes" in w]
+    if len(rss) >= MIN_WINDOWS:
+        trend = mann_kendall(rss)
+        growth = trend["slope"] * (len(rss) - 1)
+        findings["rss"] = {
+            **trend,
+            "growth_bytes": growth,
+            "growth_bytes_per_hour": trend["slope"] * per_hour,
+            "flagged": trend["p_value"] < TREND_ALPHA and growth > min_rss_growth
+        }
+
+    quarter = max(1, len(measured) // 4)
+    for key in ("p50_ms", "p99_ms"):
+        series = [w[key] for w in measured]
+        trend = mann_kendall(series)
+        drift = np.median(series[-quarter:]) / np.median(series[:quarter]) - 1
+        findings[key] = {
+            **trend,
+            "drift": float(drift),
+            "ms_per_hour": trend["slope"] * per_hour,
+            "flagged": trend["p_value"] < TREND_ALPHA and drift > max_latency_drift
+        }
+    findings["flagged"] = [name for name, finding in findings.items() if finding["flagged"]]
+    return findings
+
+
+class SoakTest:
+    """Closed-loop replay of a weighted problem mix with per-window latency and /proc sampling"""
+
+    def __init__(self, base_url: str = "http://localhost:8000", duration: float = 3600.0,
+                 window: float = 60.0, concurrency: int = 8,
+                 mix: Optional[Dict[str, float]] = None, pid: Optional[int] = None, seed: int = 0,
+                 cold_pool: int = 0):
+        self.base_url = base_url.rstrip('/')
+        self.duration = duration
+        self.window = window
+        self.concurrency = concurrency
+        self.cold_pool = cold_pool
+        self.mix = mix or {name: 1.0 for name in problem_names()}
+        for name in self.mix:
+            if name not in PROBLEMS:
+                raise ValueError(f"Unknown problem '{name}', choose from {problem_names()}")
+        self.names = list(self.mix)
+        weights = np.asarray([self.mix[name] for name in self.names], dtype=float)
+        self.weights = weights / weights.sum()
+        self.rng = np.random.default_rng(seed)
+
+        if pid is None:
+            parts = urlsplit(self.base_url)
+            if parts.hostname in ("localhost", "127.0.0.1", "::1"):
+                pid = find_listening_pid(parts.port or 80)
+        self.sampler = ProcessSampler(pid) if pid is not None else None
+        self.windows: List[Dict[str, Any]] = []
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._sent = 0
+
+    async def _worker(self, client: AsyncCTTClient, deadline: float):
+        while time.perf_counter() < deadline:
+            name = self.names[self.rng.choice(len(self.names), p=self.weights)]
+            payload = solve_payload(name)
+            if self.cold_pool:
+                payload["problem_data"]["soak_nonce"] = self._sent % self.cold_pool
+                self._sent += 1
+            start = time.perf_counter()
+            try:
+                response = await client.solve(payload["problem_data"], payload["problem_type"],
+                                              timeout=PROBLEMS[name]["timeout"])
+                ok = response.status_code == 200
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                ok = False
+            if ok:
+                self._latencies.append(time.perf_counter() - start)
+            else:
+                self._errors += 1
+
+    def _close_window(self, started: float, elapsed: float):
+        window = {"offset_s": elapsed, **latency_summary(self._latencies, self.window),
+                  "errors": self._errors}
+        self._latencies, self._errors = [], 0
+        if self.sampler is not None:
+            try:
+                window.update(self.sampler.sample())
+            except OSError:
+                # The server went away; keep soaking and report the gap
+                window["rss_bytes_missing"] = True
+        self.windows.append(window)
+        print_window(window)
+
+    async def _windows(self, started: float, deadline: float):
+        next_close = started + self.window
+        while next_close <= deadline + 1e-6:
+            await asyncio.sleep(max(0.0, next_close - time.perf_counter()))
+            self._close_window(started, next_close - started)
+            next_close += self.window
+
+    async def run(self) -> Dict[str, Any]:
+        """Soak for the configured duration and return the windows and drift verdicts"""
+        async with AsyncCTTClient(self.base_url, max_connections=self.concurrency) as client:
+            started = time.perf_counter()
+            deadline = started + self.duration
+            await asyncio.gather(self._windows(started, deadline),
+                                 *[self._worker(client, deadline) for _ in range(self.concurrency)])
+        return {
+            "base_url": self.base_url,
+            "pid": self.sampler.pid if self.sampler else None,
+            "duration": self.duration,
+            "window": self.window,
+            "concurrency": self.concurrency,
+            "cold_pool": self.cold_pool,
+            "mix": self.mix,
+            "windows": self.windows,
+            "drift": detect_drift(self.windows, self.window)
+        }
+
+
+def print_window(window: Dict[str, Any]):
+    line = f"[{window['offset_s']:>8.0f}s] {window['requests']:>7} req {window['errors']:>4} err"
+    if window["requests"]:
+        line += f"  p50 {window['p50_ms']:8.2f} ms  p99 {window['p99_ms']:8.2f} ms"
+    if "rss_bytes" in window:
+        line += f"  rss {window['rss_bytes'] / 1024 ** 2:8.1f} MiB  cpu {window['cpu_cores']:5.2f}"
+    print(line, flush=True)
+
+
+def print_drift(drift: Dict[str, Any]):
+    print("-" * 86)
+    if "note" in drift:
+        print(drift["note"])
+        return
+    if "rss" in drift:
+        rss = drift["rss"]
+        print(f"RSS trend: {rss['growth_bytes_per_hour'] / 1024 ** 2:+.2f} MiB/h "
+              f"(Mann-Kendall p={rss['p_value']:.4f}){'  ✗ GROWING' if rss['flagged'] else ''}")
+    for key in ("p50_ms", "p99_ms"):
+        finding = drift[key]
+        print(f"{key[:3]} trend: {finding['ms_per_hour']:+.3f} ms/h, last vs first quarter "
+              f"{finding['drift']:+.1%} (Mann-Kendall p={finding['p_value']:.4f})"
+              f"{'  ✗ DRIFTING' if finding['flagged'] else ''}")
+    print(f"✗ Flagged: {', '.join(drift['flagged'])}" if drift["flagged"] else "✓ No memory growth or latency drift")
+
+
+def parse_mix(entries: Optional[List[str]]) -> Optional[Dict[str, float]]:
+    """{'name': weight} from name=weight arguments (a bare name weighs 1)"""
+    if not entries:
+        return None
+    mix = {}
+    for entry in entries:
+        name, _, weight = entry.partition("=")
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak the CTT engine with a weighted problem mix")
+    parser.add_argument("--url", default="http://localhost:8000", help="Engine base URL")
+    parser.add_argument("--duration", type=float, default=3600.0, help="Seconds to soak")
+    parser.add_argument("--window", type=float, default=60.0, help="Seconds per reporting window")
+    parser.add_argument("--concurrency", type=int, default=8, help="Solves kept in flight")
+    parser.add_argument("--mix", nargs="+", default=None,
+                        help=f"name=weight entries (default: all of {problem_names()} equally)")
+    parser.add_argument("--pid", type=int, default=None,
+                        help="Server pid to sample (default: the local listener on the target port)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the problem draw")
+    parser.add_argument("--cold-pool", type=int, default=0,
+                        help="Cycle this many soak_nonce values per problem so solves miss the cache "
+                             "(default: send payloads unchanged)")
+    parser.add_argument("--output", default=None, help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    soak = SoakTest(args.url, args.duration, args.window, args.concurrency,
+                    parse_mix(args.mix), args.pid, args.seed, args.cold_pool)
+    if soak.sampler is None:
+        print("Server process not found locally; sampling latency only")
+    report = asyncio.run(soak.run())
+    print_drift(report["drift"])
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Soak report saved to '{args.output}'")
+    sys.exit(1 if report["drift"].get("flagged") else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Client-side coalescing of concurrent single solves into /api/v1/solve/batch requests
+"""
+
+import queue
+import threading
+import time
+import requests
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class SolveCoalescer:
+    """Merge solves submitted from many threads into batch requests
+
+    A batch is sent as soon as it holds max_batch_size problems, or max_wait
+    seconds after its first problem arrived, whichever comes first. Each caller
+    gets back the per-item result of its own problem.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", max_batch_size: int = 64,
+                 max_wait: float = 0.005, timeout: float = 30,
+                 session: Optional[requests.Session] = None):
+        self.base_url = base_url.rstrip('/')
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.batches_sent = 0
+        self.problems_sent = 0
+
+        self._pending: "queue.Queue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.Queue()
+        self._closed = False
+        # Held while checking _closed and queueing, so nothing lands behind close()'s sentinel
+        self._lock = threading.Lock()
+        self._flusher = threading.Thread(target=self._run, name="ctt-solve-coalescer", daemon=True)
+        self._flusher.start()
+
+    def __enter__(self) -> "SolveCoalescer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, problem_data: Any, problem_type: str = "mathematical") -> Future:
+        """Queue a solve and return a Future resolving to its per-item result"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SolveCoalescer is closed")
+            self._pending.put(({"problem_data": problem_data, "problem_type": problem_type}, future))
+        return future
+
+    def solve(self, problem_data: Any, problem_type: str = "mathematical") -> Dict[str, Any]:
+        """Blocking single solve that rides along in the next batch"""
+        return self.submit(problem_data, problem_type).result()
+
+    def close(self):
+        """Flush everything still queued and stop the background thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.put(None)
+        self._flusher.join()
+
+    def _run(self):
+        while True:
+            first = self._pending.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._send(batch)
+            if stop:
+                return
+
+    def _send(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/v1/solve/batch",
+                json={"problems": [problem for problem, _ in batch]},
+                timeout=self.timeout
+            )
+            if response.status_code != 200:
+                raise RuntimeError(f"Batch solve failed: {response.status_code} - {response.text}")
+            results = response.json()["results"]
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch solve returned {len(results)} results for {len(batch)} problems")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches_sent += 1
+        self.problems_sent += len(batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
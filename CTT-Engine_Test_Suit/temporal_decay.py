@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Reference integrator for the forced temporal decay equation
+
+    ∂²ξ/∂t² + k · sin(2π f t) · ξ = F · exp(-λ t)
+
+At f = 587 kHz an explicit solver has to step through ~10^7 forcing periods.
+The equation is linear in ξ with a coefficient of period T = 1/f, and the
+forcing only shrinks by q = exp(-λT) from one period to the next, so every
+period maps the state y = (ξ, ∂ξ/∂t) the same affine way:
+
+    y_{n+1} = M · y_n + q^n · g
+
+M and g come from integrating a single period accurately (RK4 on a fine
+substep grid). Whole blocks of periods are then evaluated at once with
+precomputed powers of that map, for a batch of initial conditions together.
+Threshold crossings are detected period by period and located within the
+crossing period on the substep grid.
+"""
+
+import re
+import numpy as np
+from typing import Dict, Any, Callable, NamedTuple, Optional, Tuple
+
+DEFAULT_SUBSTEPS = 1024
+DEFAULT_BLOCK_PERIODS = 65536
+
+_NUMBER = r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+_DECAY_EQUATION = re.compile(
+    rf"∂²ξ/∂t²\+{_NUMBER}\*sin\(2π\*{_NUMBER}\*t\)\*ξ={_NUMBER}\*exp\(-{_NUMBER}\*t\)"
+)
+
+
+class DecayParameters(NamedTuple):
+    coupling: float       # k
+    frequency: float      # f (Hz)
+    forcing: float        # F
+    decay_rate: float     # λ
+
+
+def parse_decay_equation(equation: str) -> DecayParameters:
+    """Read k, f, F and λ from '∂²ξ/∂t² + k * sin(2π * f * t) * ξ = F * exp(-λ*t)'"""
+    match = _DECAY_EQUATION.fullmatch(re.sub(r"\s+", "", equation))
+    if match is None:
+        raise ValueError(f"Unsupported decay equation '{equation}', expected the form "
+                         "'∂²ξ/∂t² + k * sin(2π * f * t) * ξ = F * exp(-λ*t)'")
+    return DecayParameters(*(float(group) for group in match.groups()))
+
+
+class ForcedDecayIntegrator:
+    """Batched stroboscopic integrator for one DecayParameters set"""
+
+    def __init__(self, parameters: DecayParameters, substeps: int = DEFAULT_SUBSTEPS):
+        if parameters.frequency <= 0:
+            raise ValueError("Forcing frequency must be positive")
+        self.parameters = parameters
+        self.period = 1.0 / parameters.frequency
+        self.substeps = substeps
+        self.q = np.exp(-parameters.decay_rate * self.period)
+        self._propagators, self._particular = self._integrate_period()
+        self.monodromy = self._propagators[-1]          # M
+        self.period_forcing = self._particular[-1]      # g
+
+    def _derivative(self, s: float, z: np.ndarray) -> np.ndarray:
+        # z is 2 × 3: columns are Φ·e1, Φ·e2 and the particular solution from rest
+        k, f, forcing, decay = self.parameters
+        a = np.array([[0.0, 1.0], [-k * np.sin(2 * np.pi * f * s), 0.0]])
+        dz = a @ z
+        dz[1, 2] += forcing * np.exp(-decay * s)
+        return dz
+
+    def _integrate_period(self) -> Tuple[np.ndarray, np.ndarray]:
+        h = self.period / self.substeps
+        z = np.zeros((2, 3))
+        z[0, 0] = z[1, 1] = 1.0
+        states = np.empty((self.substeps + 1, 2, 3))
+        states[0] = z
+        for j in range(self.substeps):
+            s = j * h
+            k1 = self._derivative(s, z)
+            k2 = self._derivative(s + h / 2, z + h / 2 * k1)
+            k3 = self._derivative(s + h / 2, z + h / 2 * k2)
+            k4 = self._derivative(s + h, z + h * k3)
+            z = z + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            states[j + 1] = z
+        return states[:, :, :2], states[:, :, 2]
+
+    def _period_powers(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """P[k] = M^k and F[k] = Σ_{j<k} M^(k-1-j) q^j g for k = 0..count, by doubling"""
+        powers = np.empty((count + 1, 2, 2))
+        forcing = np.empty((count + 1, 2))
+        powers[0] = np.eye(2)
+        forcing[0] = 0.0
+        filled = 1
+        step_power, step_forcing = self.monodromy, self.period_forcing
+        step = 1
+        while filled <= count:
+            # Extend [0, filled) by `step` = filled periods: y_{k+m} = M^m y_k + q^k F_m
+            width = min(filled, count + 1 - filled)
+            powers[filled:filled + width] = step_power @ powers[:width]
+            forcing[filled:filled + width] = (forcing[:width] @ step_power.T
+                                              + self.q ** np.arange(width)[:, None] * step_forcing)
+            filled += width
+            step_forcing = step_power @ step_forcing + self.q ** step * step_forcing
+            step_power = step_power @ step_power
+            step *= 2
+        return powers, forcing
+
+    def advance(self, states: np.ndarray, periods: int, start_period: int = 0) -> np.ndarray:
+        """States after `periods` whole periods, for a batch of states (B × 2) at start_period"""
+        states = np.asarray(states, dtype=float)
+        power, forcing = np.eye(2), np.zeros(2)
+        step_power, step_forcing, step = self.monodromy, self.period_forcing, 1
+        # Binary composition of the affine period map; `done` counts periods applied so far
+        done = 0
+        remaining = periods
+        while remaining:
+            if remaining & 1:
+                forcing = step_power @ forcing + self.q ** done * step_forcing
+                power = step_power @ power
+                done += step
+            step_forcing = step_power @ step_forcing + self.q ** step * step_forcing
+            step_power = step_power @ step_power
+            step *= 2
+            remaining >>= 1
+        return states @ power.T + self.q ** start_period * forcing
+
+    def _within_period(self, states: np.ndarray, period_index: int) -> np.ndarray:
+        """States on the substep grid of one period, shape (B × substeps+1 × 2)"""
+        return (np.einsum("sij,bj->bsi", self._propagators, states)
+                + self.q ** period_index * self._particular[None])
+
+    def state_at(self, initial_states: np.ndarray, t: float) -> np.ndarray:
+        """States at time t (nearest point of the substep grid) for a batch of initial states"""
+        periods = int(t // self.period)
+        substep = min(self.substeps, int(round((t - periods * self.period) / self.period * self.substeps)))
+        states = self.advance(initial_states, periods)
+        return self._within_period(states, periods)[:, substep]
+
+    def first_crossing(self, initial_states: np.ndarray, threshold: float, horizon: float,
+                       block_periods: int = DEFAULT_BLOCK_PERIODS,
+                       progress: Optional[Callable[[float], None]] = None) -> np.ndarray:
+        """First time in [0, horizon] at which ξ crosses threshold, per initial state (inf if never)
+
+        Crossings are detected on period boundaries and then located on the
+        substep grid of the crossing period, by linear interpolation.
+        progress, if given, is called with the fraction of periods scanned after every block.
+        """
+        states = np.atleast_2d(np.asarray(initial_states, dtype=float))
+        batch = states.shape[0]
+        crossing = np.full(batch, np.inf)
+        side = np.sign(states[:, 0] - threshold)
+        crossing[side == 0] = 0.0
+        pending = side != 0
+
+        total_periods = int(horizon // self.period)
+        powers, forcing = self._period_powers(block_periods)
+        start = 0
+        while start < total_periods and pending.any():
+            count = min(block_periods, total_periods - start)
+            # ξ at the end of every period in the block: (B × count)
+            xi = (states @ powers[1:count + 1, 0, :].T
+                  + self.q ** start * forcing[1:count + 1, 0])
+            crossed = np.sign(xi - threshold) != side[:, None]
+            crossed &= pending[:, None]
+            for b in np.flatnonzero(crossed.any(axis=1)):
+                period = start + int(np.argmax(crossed[b]))
+                period_start = self.advance(states[b:b + 1], period - start, start)
+                crossing[b] = self._locate(period_start, period, threshold, side[b])
+                pending[b] = False
+            states = states @ powers[count].T + self.q ** start * forcing[count]
+            start += count
+            if progress is not None:
+                progress(start / total_periods)
+
+        # Remaining partial period up to the horizon
+        if pending.any() and start * self.period < horizon:
+            last = min(self.substeps, int(np.ceil((horizon - start * self.period) / self.period * self.substeps)))
+            xi = self._within_period(states, start)[:, :last + 1, 0]
+            for b in np.flatnonzero(pending):
+                if (np.sign(xi[b] - threshold) != side[b]).any():
+                    crossing[b] = self._locate(states[b:b + 1], start, threshold, side[b])
+        crossing[crossing > horizon] = np.inf
+        return crossing
+
+    def _locate(self, period_start: np.ndarray, period: int, threshold: float, side: float) -> float:
+        xi = self._within_period(period_start, period)[0, :, 0]
+        j = int(np.argmax(np.sign(xi - threshold) != side))
+        fraction = (threshold - xi[j - 1]) / (xi[j] - xi[j - 1]) if j > 0 else 0.0
+        return (period + (j - 1 + fraction) / self.substeps) * self.period if j > 0 else period * self.period
+
+
+def channel_initial_states(readings: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """(ξ, ∂ξ/∂t) of every channel at t = 0 from a least-squares line through its readings"""
+    slope, intercept = np.polyfit(times, readings, 1)
+    return np.column_stack([intercept, slope])
+
+
+def predict_decay(problem: Dict[str, Any], initial_states: Optional[np.ndarray] = None,
+                  substeps: int = DEFAULT_SUBSTEPS,
+                  progress: Optional[Callable[[float], None]] = None) -> Dict[str, Any]:
+    """Integrate a temporal decay problem from t = 0 to its horizon
+
+    Every channel starts from the (ξ, ∂ξ/∂t) of a line fitted through its
+    readings, unless explicit initial_states (B × 2) are given. progress is
+    called with the fraction of the horizon scanned for threshold crossings.
+    """
+    parameters = parse_decay_equation(problem["decay_equation"])
+    readings = np.asarray(problem["resonance_readings"], dtype=float)       # (T, channels)
+    times = np.asarray(problem["time_intervals"], dtype=float)
+    if readings.ndim != 2 or times.ndim != 1 or readings.shape[0] != times.size:
+        raise ValueError("resonance_readings needs one row per entry of time_intervals")
+    if times.size < 2:
+        raise ValueError("time_intervals needs at least two entries to fit each channel's line")
+    threshold = float(problem.get("critical_threshold", 1.0))
+    horizon = float(problem.get("prediction_horizon", times[-1]))
+
+    if initial_states is None:
+        initial_states = channel_initial_states(readings, times)
+    integrator = ForcedDecayIntegrator(parameters, substeps)
+    final = integrator.state_at(initial_states, horizon)
+    crossing = integrator.first_crossing(initial_states, threshold, horizon, progress=progress)
+
+    return {
+        "equation_parameters": parameters._asdict(),
+        "periods_integrated": int(horizon // integrator.period),
+        "predicted_readings": final[:, 0].tolist(),
+        "predicted_rates": final[:, 1].tolist(),
+        "channels_over_threshold": np.flatnonzero(np.isfinite(crossing)).tolist(),
+        "threshold_crossing_times": [float(t) if np.isfinite(t) else None for t in crossing],
+        "critical_threshold": threshold,
+        "prediction_horizon": horizon
+    }
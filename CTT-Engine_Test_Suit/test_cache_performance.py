@@ -1,14 +1,17 @@
+import sys
+import asyncio
 import requests
 import time
+import numpy as np
+from ctt_problems import CACHE_TEST_PROBLEM, problem_hash
+from result_cache import ResultCache
+from capacity_search import CapacitySearch, problem_types
 
 def test_cache_performance():
     """Test cache performance by solving the same problem multiple times"""
     print("Testing Cache Performance...")
     
-    problem = {
-        "expression": "sin(ξ) * exp(-ξ^2)",
-        "description": "Test function for cache performance"
-    }
+    problem = CACHE_TEST_PROBLEM
     
     times = []
     
@@ -40,5 +43,138 @@ def test_cache_performance():
     
     return True
 
+def test_problem_hash_keys():
+    """problem_hash: equivalent formulations share a key, different problems do not"""
+    print("\nTesting problem_hash Canonicalization...")
+    
+    # Decimal readings computed two ways differ in their last bits only
+    readings = np.arange(2048) * 0.001
+    same = [
+        ({"expression": "sin(ξ) * exp(-ξ^2)"}, {"expression": "exp(-x**2)*sin(xi)"}),
+        ({"expression": "-(1-ξ)"}, {"expression": "ξ - 1"}),
+        ({"expression": "2*π*ξ", "range": [0, 1]}, {"expression": "ξ*2*pi", "range": [0.0, 1.0]}),
+        ({"range": [0.1 + 0.2, 1]}, {"range": [0.3, 1]}),
+        ({"readings": readings}, {"readings": [i / 1000 for i in range(2048)]}),
+        ({"readings": np.arange(10)}, {"readings": list(range(10))}),
+        ({"readings": np.arange(2000)}, {"readings": np.arange(2000, dtype=float)}),
+    ]
+    different = [
+        ({"expression": "ξ - 1"}, {"expression": "1 - ξ"}),
+        ({"expression": "sin(ξ)"}, {"expression": "cos(ξ)"}),
+        ({"range": [0, 1]}, {"range": [0, 1.001]}),
+        ({"readings": readings}, {"readings": readings * 1.001}),
+    ]
+    passed = True
+    for i, (first, second) in enumerate(same):
+        if problem_hash(first, "mathematical") != problem_hash(second, "mathematical"):
+            print(f"✗ Equivalent pair {i} ({', '.join(first)}) got different keys")
+            passed = False
+    for i, (first, second) in enumerate(different):
+        if problem_hash(first, "mathematical") == problem_hash(second, "mathematical"):
+            print(f"✗ Different pair {i} ({', '.join(first)}) got the same key")
+            passed = False
+    if problem_hash({"expression": "ξ"}, "mathematical") == problem_hash({"expression": "ξ"}, "physics"):
+        print("✗ problem_type is not part of the key")
+        passed = False
+    try:
+        # Folds to a complex constant; must still hash
+        problem_hash({"expression": "(-8)^(1/3) * ξ"}, "mathematical")
+    except Exception as e:
+        print(f"✗ Complex constant failed to hash: {e!r}")
+        passed = False
+    if passed:
+        print(f"✓ {len(same)} equivalent pairs share a key, {len(different)} different pairs do not")
+    return passed
+
+def test_result_cache(max_entries=3, ttl=0.05):
+    """ResultCache evicts the least recently used entry and drops expired ones"""
+    print("\nTesting Result Cache Eviction and Expiry...")
+    
+    problems = [{"expression": f"sin({n}*ξ)"} for n in range(max_entries + 1)]
+    response = {"status": "success", "solution": {"value": 1.0}}
+    passed = True
+    with ResultCache(":memory:", max_entries=max_entries) as cache:
+        for problem in problems[:max_entries]:
+            cache.put(problem, "mathematical", response)
+            time.sleep(0.002)
+        # Touch the oldest entry so the second one becomes least recently used
+        cache.get(problems[0], "mathematical")
+        time.sleep(0.002)
+        cache.put(problems[-1], "mathematical", response)
+        kept = [cache.get(problem, "mathematical") is not None for problem in problems]
+        if kept != [True, False] + [True] * (max_entries - 1) or cache.evictions != 1:
+            print(f"✗ Entries kept after overflow: {kept}, {cache.evictions} evictions")
+            passed = False
+        
+        fetches = []
+        def fetch(data, kind):
+            fetches.append(data)
+            return response
+        cache.solve(problems[0], "physics", fetch)
+        cache.solve(problems[0], "physics", fetch)
+        if len(fetches) != 1:
+            print(f"✗ solve fetched {len(fetches)} times for one problem")
+            passed = False
+    
+    with ResultCache(":memory:", ttl=ttl) as cache:
+        cache.put(problems[0], "mathematical", response)
+        cache.put(problems[1], "mathematical", response, ttl=60)
+        cached = cache.get(problems[0], "mathematical") is not None
+        time.sleep(2 * ttl)
+        expired = cache.get(problems[0], "mathematical") is None
+        if not (cached and expired) or cache.get(problems[1], "mathematical") is None:
+            print(f"✗ TTL entry cached={cached} expired={expired}, or the 60s entry expired early")
+            passed = False
+    
+    if passed:
+        print(f"✓ LRU entry evicted at {max_entries} entries, {ttl}s entry expired")
+    return passed
+
+class _ThresholdSearch(CapacitySearch):
+    """CapacitySearch whose steps pass at or below a fixed capacity instead of sending requests"""
+    
+    def __init__(self, capacity, **kwargs):
+        super().__init__(**kwargs)
+        self.capacity = capacity
+    
+    async def step(self, client, names, rate):
+        return {"offered_rps": rate, "passed": rate <= self.capacity}
+
+def test_capacity_search(capacity=137.0, tolerance=0.05):
+    """The rate search brackets a known capacity and gives up cleanly when nothing passes"""
+    print("\nTesting Capacity Search Against a Known Capacity...")
+    
+    problem_type = problem_types()[0]
+    passed = True
+    for mode in ("binary", "aimd"):
+        search = _ThresholdSearch(capacity, initial_rate=10.0, tolerance=tolerance)
+        result = asyncio.run(search.search(problem_type, mode))
+        knee = result["knee"]["offered_rps"] if result["knee"] else None
+        lowest = capacity * (1 - tolerance) if mode == "binary" else capacity / 2
+        if knee is None or not lowest <= knee <= capacity:
+            print(f"✗ {mode}: knee {knee} outside [{lowest:.1f}, {capacity}]")
+            passed = False
+    
+    search = _ThresholdSearch(0.0, initial_rate=10.0, min_rate=1.0)
+    result = asyncio.run(search.search(problem_type, "binary"))
+    rates = [point["offered_rps"] for point in result["curve"]]
+    if result["knee"] is not None or min(rates) < 0.5:
+        print(f"✗ Always-failing engine: knee {result['knee']}, lowest rate {min(rates)}")
+        passed = False
+    
+    if passed:
+        print(f"✓ Both modes found a knee at or below {capacity}/s; an always-failing engine stops after {len(rates)} steps")
+    return passed
+
 if __name__ == "__main__":
-    test_cache_performance()
+    # "python test_cache_performance.py benchmark [options]" runs the full
+    # hit-ratio benchmark (see cache_benchmark.py --help for the options)
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        import cache_benchmark
+        sys.argv.pop(1)
+        cache_benchmark.main()
+    else:
+        test_problem_hash_keys()
+        test_result_cache()
+        test_capacity_search()
+        test_cache_performance()
@@ -1,16 +1,16 @@
 import requests
 import json
+import numpy as np
+from ctt_binary import BinaryFormatError, decode_body, encode_binary, pack_arrays, solve_binary
+from ctt_problems import MASS_TEMPORAL_PROBLEM, RESONANCE_PROBLEM
+from temporal_decay import DecayParameters, ForcedDecayIntegrator
 
 def test_physics_problems():
     """Test physics-related problems"""
     print("Testing Physics Problems...")
     
     # Mass-temporal relation problem
-    physics_problem = {
-        "problem_type": "mass_temporal",
-        "temporal_acceleration": 0.15,
-        "description": "Calculate mass from temporal acceleration using m = (ħ/c²) * (∂²ξ/∂t²)"
-    }
+    physics_problem = MASS_TEMPORAL_PROBLEM
     
     try:
         response = requests.post(
@@ -38,14 +38,7 @@ def test_resonance_frequency():
     """Test resonance frequency calculation"""
     print("\nTesting Resonance Frequency...")
     
-    resonance_problem = {
-        "problem_type": "resonance_calculation",
-        "parameters": {
-            "fine_structure_constant": 1/137.035999,
-            "temporal_mass": 0.0,
-            "energy_scale": 1.956e9
-        }
-    }
+    resonance_problem = RESONANCE_PROBLEM
     
     try:
         response = requests.post(
@@ -69,6 +62,116 @@ def test_resonance_frequency():
         print(f"Exception: {e}")
         return False
 
+def test_resonance_grid(points=1000):
+    """Evaluate resonance over a points × points parameter grid in one binary request"""
+    print(f"\nTesting Resonance Grid ({points}×{points} parameter combinations)...")
+    
+    alpha = np.linspace(0.5, 2.0, points)[:, None] / 137.035999
+    energy_scale = np.linspace(1e9, 3e9, points)
+    problem = {
+        "problem_type": "resonance_calculation",
+        "parameters": {"fine_structure_constant": alpha, "temporal_mass": 0.0, "energy_scale": energy_scale}
+    }
+    
+    try:
+        result = solve_binary(requests.Session(), "http://localhost:8000", problem, "physics", timeout=60)
+        if result.get("status") != "success":
+            print(f"Error: {result.get('error')}")
+            return False
+        frequency = np.asarray(result["solution"]["resonance_frequency_hz"])
+        expected = alpha * energy_scale / (2 * np.pi)
+        if frequency.shape != expected.shape or not np.allclose(frequency, expected, rtol=1e-12):
+            print(f"✗ Grid mismatch: shape {frequency.shape}, expected {expected.shape}")
+            return False
+        print(f"✓ {frequency.size} frequencies in {result.get('computation_time', 0):.3f}s engine time")
+        return True
+            
+    except Exception as e:
+        print(f"Exception: {e}")
+        return False
+
+def test_binary_round_trip(elements=4096):
+    """Arrays survive a multipart .npy encode/decode with dtype, shape and values intact"""
+    print("\nTesting Binary Multipart Round Trip...")
+    
+    rng = np.random.default_rng(0)
+    payload = {
+        "grid": rng.normal(size=(64, elements // 64)),
+        "counts": np.arange(elements, dtype=np.int32),
+        "columns": np.asfortranarray(rng.normal(size=(8, 3))),
+        "readings": [[0.1 * i, 0.2 * i] for i in range(elements)],
+        "small": [1.0, 2.0, 3.0],
+        "label": "ξ",
+        "scale": np.float64(2.5)
+    }
+    
+    packed = pack_arrays(payload)
+    body, content_type = encode_binary(packed)
+    decoded = decode_body(body, content_type)
+    
+    passed = True
+    for key in ("grid", "counts", "columns", "readings"):
+        expected = np.asarray(packed[key])
+        array = decoded[key]
+        if not (isinstance(array, np.ndarray) and array.dtype == expected.dtype
+                and array.shape == expected.shape and np.array_equal(array, expected)):
+            print(f"✗ '{key}' did not round trip: {type(array).__name__}")
+            passed = False
+        elif array.flags.writeable:
+            print(f"✗ '{key}' decoded as a copy instead of a read-only view")
+            passed = False
+    if decoded["small"] != payload["small"] or decoded["label"] != "ξ" or decoded["scale"] != 2.5:
+        print(f"✗ JSON fields changed: {decoded['small']}, {decoded['label']}, {decoded['scale']}")
+        passed = False
+    
+    corrupt = body.replace(b"\x93NUMPY", b"\x93NUMPX", 1)
+    try:
+        decode_body(corrupt, content_type)
+        print("✗ Corrupt .npy part was accepted")
+        passed = False
+    except BinaryFormatError:
+        pass
+    
+    if passed:
+        print(f"✓ {len(body) / 1024:.0f} KiB body round trips 4 arrays and the JSON fields")
+    return passed
+
+def test_decay_integrator(periods=7, substeps=64):
+    """The stroboscopic period map agrees with RK4 stepped through every substep"""
+    print("\nTesting Forced Decay Integrator Against Brute-Force Stepping...")
+    
+    parameters = DecayParameters(coupling=40.0, frequency=2.0, forcing=3.0, decay_rate=0.5)
+    integrator = ForcedDecayIntegrator(parameters, substeps)
+    initial = np.array([[1.0, 0.0], [-0.5, 2.0], [0.2, -1.0]])
+    h = integrator.period / substeps
+    
+    def derivative(t, y):
+        k, f, forcing, decay = parameters
+        return np.column_stack([y[:, 1], -k * np.sin(2 * np.pi * f * t) * y[:, 0] + forcing * np.exp(-decay * t)])
+    
+    # Off-grid time: state_at picks the nearest substep
+    t = (periods + 0.3) * integrator.period + 0.4 * h
+    steps = periods * substeps + int(round((t / integrator.period - periods) * substeps))
+    y = initial.copy()
+    for j in range(steps):
+        s = j * h
+        k1 = derivative(s, y)
+        k2 = derivative(s + h / 2, y + h / 2 * k1)
+        k3 = derivative(s + h / 2, y + h / 2 * k2)
+        k4 = derivative(s + h, y + h * k3)
+        y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    
+    state = integrator.state_at(initial, t)
+    error = float(np.max(np.abs(state - y)) / max(1.0, np.max(np.abs(y))))
+    if error > 1e-9:
+        print(f"✗ state_at differs from {steps} RK4 steps by {error:.2e}")
+        return False
+    print(f"✓ Agree to {error:.1e} after {steps} substeps for {len(initial)} initial states")
+    return True
+
 if __name__ == "__main__":
     test_physics_problems()
     test_resonance_frequency()
+    test_resonance_grid()
+    test_binary_round_trip()
+    test_decay_integrator()
@@ -3,13 +3,23 @@
 Quick test of retrocausal computation
 """
 
-from retrocausal_demo import RetrocausalDemo
+import numpy as np
+from retrocausal_stream import StreamingRetrocausalPredictor
+
+try:
+    from retrocausal_demo import RetrocausalDemo
+except ImportError:
+    RetrocausalDemo = None
 
 def quick_test():
     """Quick test function"""
     print("Quick Retrocausal Test")
     print("=" * 30)
     
+    if RetrocausalDemo is None:
+        print("⚠ retrocausal_demo is not available, skipping")
+        return None
+    
     demo = RetrocausalDemo()
     
     # Just test basic functionality
@@ -23,5 +33,37 @@ def quick_test():
         print("Test failed")
         return False
 
+def test_streaming_matches_polyfit(samples=20000, window=256, prediction_points=5, seed=0):
+    """After every randomly sized chunk the streamed forecast equals np.polyfit over the window"""
+    print("\nTesting Streaming Forecast Against np.polyfit...")
+    
+    rng = np.random.default_rng(seed)
+    t = np.arange(samples)
+    data = 0.001 * t + np.sin(t / 50.0) + 0.1 * rng.standard_normal(samples)
+    predictor = StreamingRetrocausalPredictor(window, prediction_points)
+    
+    worst, chunks, seen = 0.0, 0, 0
+    while seen < samples:
+        # Chunks from a single sample to several windows long
+        size = int(rng.integers(1, 3 * window))
+        predictor.extend(data[seen:seen + size])
+        seen = min(seen + size, samples)
+        chunks += 1
+        
+        recent = data[max(0, seen - window):seen]
+        x = np.arange(recent.size)
+        if recent.size < 2:
+            expected = np.full(prediction_points, recent[-1])
+        else:
+            expected = np.polyval(np.polyfit(x, recent, 1), recent.size + np.arange(prediction_points))
+        worst = max(worst, float(np.max(np.abs(predictor.forecast() - expected))))
+    
+    if worst > 1e-9:
+        print(f"✗ Streamed forecast differs from np.polyfit by up to {worst:.2e}")
+        return False
+    print(f"✓ {chunks} chunks, forecasts within {worst:.1e} of np.polyfit")
+    return True
+
 if __name__ == "__main__":
     quick_test()
+    test_streaming_matches_polyfit()
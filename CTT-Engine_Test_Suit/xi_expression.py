@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Compile ξ-expressions such as 'sin(ξ) * exp(-ξ^2) + cos(2*π*ξ)' into vectorized NumPy callables
+
+The text is parsed once, checked against a whitelist of arithmetic and NumPy
+functions, and compiled to a function of an array of ξ values. Compiled forms
+are kept in an LRU cache keyed by the normalized expression text, so spacing
+and notation variants ('ξ^2', 'xi ** 2', 'x**2') share one entry.
+
+canonical_expression goes further for hashing: it sorts the operands of
+sums and products, folds constant sub-expressions and rounds literals, so
+'2*π*ξ', 'ξ*2*pi' and '6.283185307179586*x' all map to the same text.
+"""
+
+import ast
+import re
+import numpy as np
+from functools import lru_cache
+from typing import Callable
+
+FUNCTIONS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "arcsin": np.arcsin, "arccos": np.arccos, "arctan": np.arctan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "sqrt": np.sqrt, "abs": np.abs
+}
+CONSTANTS = {"pi": np.pi, "e": np.e}
+VARIABLE = "xi"
+VARIABLE_ALIASES = {"xi", "x", "ξ"}
+# Significant digits kept by canonical_number; absorbs last-bit rounding noise
+CANONICAL_DIGITS = 15
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd
+)
+# '2π', '2πξ', '2(ξ + 1)' and ')(' are products; identifiers such as 'log10(' are not
+_IMPLICIT_PRODUCT = re.compile(r"((?<![\w.])\d+(?:\.\d*)?|[)πξ])\s*(?=[πξ(])")
+
+CompiledExpression = Callable[[np.ndarray], np.ndarray]
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed or uses unsupported syntax"""
+
+
+def _translate(expression: str) -> str:
+    text = expression.strip()
+    # 'ψ(ξ) = ...' and 'c(ξ) = ...' definitions: keep the right-hand side
+    if text.count("=") == 1:
+        text = text.split("=", 1)[1]
+    text = _IMPLICIT_PRODUCT.sub(r"\1*", text)
+    return (text.replace("π", "pi").replace("ξ", VARIABLE)
+            .replace("²", "**2").replace("^", "**").strip())
+
+
+def _parse(expression: str) -> ast.Expression:
+    try:
+        tree = ast.parse(_translate(expression), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Cannot parse expression '{expression}': {e.msg}")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(f"Unsupported syntax '{type(node).__name__}' in '{expression}'")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ExpressionError(f"Unsupported literal {node.value!r} in '{expression}'")
+        if isinstance(node, ast.Call):
+            if (not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS
+                    or node.keywords or len(node.args) != 1):
+                raise ExpressionError(f"Unsupported call '{ast.unparse(node)}' in '{expression}'")
+        elif isinstance(node, ast.Name):
+            if node.id in VARIABLE_ALIASES:
+                node.id = VARIABLE
+            elif node.id not in FUNCTIONS and node.id not in CONSTANTS:
+                raise ExpressionError(f"Unknown name '{node.id}' in '{expression}'")
+    return tree
+
+
+def normalize_expression(expression: str) -> str:
+    """Canonical text of an expression, e.g. 'sin(ξ)*exp(-ξ^2)' -> 'sin(xi) * exp(-xi ** 2)'"""
+    return ast.unparse(_parse(expression))
+
+
+def canonical_numbers(values) -> np.ndarray:
+    """values rounded to CANONICAL_DIGITS significant digits, as a float array
+
+    Values too small to scale (below ~1e-292) and non-finite values are kept
+    as they are; -0.0 becomes 0.0.
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(all="ignore"):
+        exponent = np.floor(np.log10(np.abs(values)))
+        scale = 10.0 ** (CANONICAL_DIGITS - 1 - np.where(np.isfinite(exponent), exponent, 0.0))
+        rounded = np.round(values * scale) / scale
+    return np.where(np.isfinite(rounded), rounded, values) + 0.0
+
+
+def canonical_number(value: float) -> float:
+    """value rounded to CANONICAL_DIGITS significant digits, as a float"""
+    return float(canonical_numbers(value))
+
+
+def _constant(node: ast.AST):
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _fold(function, *operands) -> ast.AST:
+    """Constant node for function(*operands), or None if it does not evaluate to a finite real float"""
+    try:
+        with np.errstate(all="ignore"):
+            # (-8) ** (1/3) is complex, and float() of a complex raises TypeError
+            value = float(function(*operands))
+    except (ArithmeticError, TypeError, ValueError):
+        return None
+    return ast.Constant(value) if np.isfinite(value) else None
+
+
+def _flatten(node: ast.AST, operators, sign: int = 1):
+    """(sign, operand) pairs of a chain of the given associative operators"""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, operators):
+        negate = -1 if isinstance(node.op, ast.Sub) else 1
+        return _flatten(node.left, operators, sign) + _flatten(node.right, operators, sign * negate)
+    return [(sign, node)]
+
+
+def _chain(constant: float, identity: float, operands, operator) -> ast.AST:
+    # Rebuild a sum or product: sorted operands, then the folded constant
+    operands = sorted(operands, key=lambda term: ast.unparse(term[1]))
+    if constant != identity or not operands:
+        operands.append((1 if constant >= 0 or operator is ast.Mult else -1,
+                         ast.Constant(abs(constant) if operator is ast.Add else constant)))
+    sign, tree = operands[0]
+    if sign < 0:
+        tree = ast.UnaryOp(ast.USub(), tree)
+    for sign, term in operands[1:]:
+        tree = ast.BinOp(tree, ast.Sub() if sign < 0 else operator(), term)
+    return tree
+
+
+def _canonical(node: ast.AST) -> ast.AST:
+    # Constants fold at full precision; canonical_expression rounds the result
+    if isinstance(node, ast.Constant):
+        return ast.Constant(float(node.value))
+    if isinstance(node, ast.Name):
+        return ast.Constant(float(CONSTANTS[node.id])) if node.id in CONSTANTS else node
+    if isinstance(node, ast.UnaryOp):
+        operand = _canonical(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if _constant(operand) is not None:
+            return ast.Constant(-operand.value)
+        if isinstance(operand, ast.UnaryOp):
+            return operand.operand
+        if isinstance(operand, ast.BinOp) and isinstance(operand.op, (ast.Add, ast.Sub)):
+            # -(1 - ξ) is the sum ξ - 1: distribute the sign so both get one canonical form
+            return _canonical(ast.BinOp(ast.Constant(0.0), ast.Sub(), operand))
+        return ast.UnaryOp(ast.USub(), operand)
+    if isinstance(node, ast.Call):
+        argument = _canonical(node.args[0])
+        if _constant(argument) is not None:
+            folded = _fold(FUNCTIONS[node.func.id], argument.value)
+            if folded is not None:
+                return folded
+        return ast.Call(node.func, [argument], [])
+
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        constant, terms = 0.0, []
+        for outer, term in _flatten(node, (ast.Add, ast.Sub)):
+            # A term may canonicalize to a sum itself (a negated sum); merge its terms in
+            for sign, term in _flatten(_canonical(term), (ast.Add, ast.Sub), outer):
+                if isinstance(term, ast.UnaryOp):
+                    sign, term = -sign, term.operand
+                if _constant(term) is not None:
+                    constant += sign * term.value
+                else:
+                    terms.append((sign, term))
+        return _chain(constant, 0.0, terms, ast.Add)
+    if isinstance(node.op, ast.Mult):
+        constant, factors = 1.0, []
+        for _, factor in _flatten(node, (ast.Mult,)):
+            factor = _canonical(factor)
+            if isinstance(factor, ast.UnaryOp):
+                constant, factor = -constant, factor.operand
+            if _constant(factor) is not None:
+                constant *= factor.value
+            else:
+                factors.append((1, factor))
+        if constant == -1.0 and factors:
+            return ast.UnaryOp(ast.USub(), _chain(1.0, 1.0, factors, ast.Mult))
+        return _chain(constant, 1.0, factors, ast.Mult)
+
+    left, right = _canonical(node.left), _canonical(node.right)
+    if _constant(left) is not None and _constant(right) is not None:
+        operator = {ast.Div: lambda a, b: a / b, ast.Pow: lambda a, b: a ** b}[type(node.op)]
+        folded = _fold(operator, left.value, right.value)
+        if folded is not None:
+            return folded
+    return ast.BinOp(left, node.op, right)
+
+
+@lru_cache(maxsize=4096)
+def canonical_expression(expression: str) -> str:
+    """Semantic canonical text for hashing, e.g. 'exp(-(ξ^2)) * 2π' -> 'exp(-xi ** 2.0) * 6.28318530717959'
+
+    Sums and products have their operands sorted and constants folded,
+    negated sums are distributed, and pi/π/e become literals, all rounded by canonical_number at the end. The
+    result evaluates to the same function up to rounding, but is meant as a
+    cache key rather than for evaluation.
+    """
+    tree = _canonical(_parse(expression).body)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant):
+            node.value = canonical_number(node.value)
+    return ast.unparse(tree)
+
+
+@lru_cache(maxsize=1024)
+def _compile_normalized(normalized: str) -> CompiledExpression:
+    tree = ast.parse(f"lambda {VARIABLE}: {normalized}", mode="eval")
+    # Float literals keep constant sub-expressions like 9**9**9 in bounded float
+    # arithmetic instead of arbitrary-precision integer arithmetic
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, int):
+            node.value = float(node.value)
+    code = compile(tree, "<xi-expression>", "eval")
+    function = eval(code, {"__builtins__": {}, **FUNCTIONS, **CONSTANTS})
+
+    def evaluate(xi: np.ndarray) -> np.ndarray:
+        xi = np.asarray(xi, dtype=float)
+        try:
+            with np.errstate(over="ignore"):
+                values = function(xi)
+        except (OverflowError, ZeroDivisionError) as e:
+            raise ExpressionError(f"Cannot evaluate '{normalized}': {e}")
+        if np.shape(values) != xi.shape:
+            values = np.broadcast_to(values, xi.shape)
+        return values
+
+    evaluate.expression = normalized
+    return evaluate
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(expression: str) -> CompiledExpression:
+    """Compile an expression into a vectorized function of ξ, cached by its normalized text"""
+    return _compile_normalized(normalize_expression(expression))
+
+
+def evaluate(expression: str, xi: np.ndarray) -> np.ndarray:
+    """Evaluate an expression over an array of ξ values"""
+    return compile_expression(expression)(xi)
+
+
+def cache_info():
+    """Hit/miss statistics of the raw-text and normalized-text caches"""
+    return {"text": compile_expression.cache_info(), "normalized": _compile_normalized.cache_info()}